@@ -7,6 +7,8 @@ parsing and validation functionality for YAML front matter.
 Based on core.md section 10 specifications.
 """
 
+import functools
+import os
 import yaml
 import re
 from datetime import datetime
@@ -15,6 +17,12 @@ from typing import Dict, List, Any, Optional, Tuple
 from rich.console import Console
 from rich.panel import Panel
 
+# Prefer the libyaml-backed loader; the pure-Python SafeLoader is several times slower
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 console = Console()
 
 # Required metadata fields based on core.md section 10
@@ -43,22 +51,65 @@ OPTIONAL_FIELDS = {
     'discussion_theme': str,       # Override default Giscus theme
 }
 
+# Every field the validator knows; anything else draws an "unknown field" warning
+KNOWN_FIELDS = frozenset(REQUIRED_FIELDS) | frozenset(OPTIONAL_FIELDS)
+
 # Valid content types for type field validation
-CONTENT_TYPES = [
+CONTENT_TYPES = (
     'tutorial', 'documentation', 'overview', 'note', 
     'homework', 'project', 'reference', 'test', 'master-index'
-]
+)
 
 # Content types that get discussions enabled by default
-DISCUSSION_ENABLED_TYPES = [
+DISCUSSION_ENABLED_TYPES = (
     'tutorial', 'note', 'homework', 'project', 'documentation'
-]
+)
+
+# Valid values of the slug_source field
+SLUG_SOURCES = ('creation_context', 'manual')
 
 # Date format pattern (YYYY-MM-DD)
-DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
 
 # Slug format pattern (URL-safe)
-SLUG_PATTERN = re.compile(r'^[a-z0-9-]+$')
+SLUG_PATTERN = re.compile(r'[a-z0-9-]+')
+
+# Slug title sanitizing: characters dropped, then runs collapsed to one hyphen
+SLUG_TITLE_STRIP_PATTERN = re.compile(r'[^\w\s-]')
+SLUG_TITLE_SEPARATOR_PATTERN = re.compile(r'[-\s]+')
+
+# File naming patterns (file name without .md), compiled once and applied with fullmatch
+HOMEWORK_NAME_PATTERN = re.compile(r'hw_\d+')
+APPENDIX_NAME_PATTERN = re.compile(r'[A-Z]_[a-z0-9_]+')
+NUMBERED_NAME_PATTERN = re.compile(r'\d{2}_[a-z0-9_]+')
+PLAIN_NAME_PATTERN = re.compile(r'[a-z0-9_]+')
+
+# All naming patterns as one alternation; lastgroup names the pattern that matched
+FILE_NAME_PATTERN = re.compile('|'.join(
+    f'(?P<{kind}>{pattern.pattern})' for kind, pattern in (
+        ('homework', HOMEWORK_NAME_PATTERN),
+        ('appendix', APPENDIX_NAME_PATTERN),
+        ('numbered', NUMBERED_NAME_PATTERN),
+        ('plain', PLAIN_NAME_PATTERN),
+    )
+))
+
+# Error reported when a name does not match the pattern its prefix calls for
+FILE_NAME_ERRORS = {
+    'homework': "Homework files must follow pattern 'hw_NN.md' (e.g., hw_01.md)",
+    'appendix': "Appendix files must follow pattern 'A_descriptive_name.md' with capital letter prefix",
+    'numbered': "Content files must follow pattern 'NN_descriptive_name.md' with lowercase and underscores",
+    'plain': "File names should use lowercase letters, numbers, and underscores only",
+}
+
+# Generated index files; they satisfy the naming rules by construction
+INDEX_FILENAMES = frozenset({'00_index.md', '00_master_index.md'})
+
+# Directories that never hold content; pruned without being entered
+NON_CONTENT_DIRS = frozenset({'.git', 'node_modules', '.framework_cache', '__pycache__'})
+
+# Characters read per step while looking for the end of the front matter
+FRONTMATTER_READ_SIZE = 4096
 
 class MetadataError(Exception):
     """Custom exception for metadata validation errors"""
@@ -85,7 +136,7 @@ class MetadataParser:
         self.warnings = []
         
         try:
-            content = file_path.read_text(encoding='utf-8')
+            content = _read_frontmatter_region(file_path)
         except Exception as e:
             self.errors.append(f"Could not read file: {e}")
             return {}, self.errors, self.warnings
@@ -104,7 +155,7 @@ class MetadataParser:
             
             # Extract and parse YAML
             yaml_content = content[4:end_match]
-            metadata = yaml.safe_load(yaml_content) or {}
+            metadata = yaml.load(yaml_content, Loader=_Loader) or {}
             
         except yaml.YAMLError as e:
             self.errors.append(f"Invalid YAML syntax: {e}")
@@ -148,7 +199,7 @@ class MetadataParser:
                     )
             
             elif field == 'date':
-                if not DATE_PATTERN.match(value):
+                if not DATE_PATTERN.fullmatch(value):
                     self.errors.append(
                         f"Date '{value}' must be in YYYY-MM-DD format"
                     )
@@ -187,20 +238,51 @@ class MetadataParser:
                     )
                     
             elif field == 'slug_source' and value:
-                valid_sources = ['creation_context', 'manual']
-                if value not in valid_sources:
+                if value not in SLUG_SOURCES:
                     self.errors.append(
-                        f"Invalid slug_source '{value}'. Must be one of: {', '.join(valid_sources)}"
+                        f"Invalid slug_source '{value}'. Must be one of: {', '.join(SLUG_SOURCES)}"
                     )
         
         # Check for unknown fields (warnings only)
-        all_known_fields = set(REQUIRED_FIELDS.keys()) | set(OPTIONAL_FIELDS.keys())
         for field in metadata:
-            if field not in all_known_fields:
+            if field not in KNOWN_FIELDS:
                 self.warnings.append(f"Unknown field '{field}' - will be ignored")
         
         return metadata
 
+# Shared by the module-level helpers; parse_frontmatter starts each file with
+# fresh error and warning lists
+_DEFAULT_PARSER = MetadataParser()
+
+def _read_frontmatter_region(file_path: Path) -> str:
+    """
+    Read a markdown file only as far as the end of its front matter.
+    
+    Bodies can be large (embedded images, long notes) while the metadata is a
+    few hundred bytes, so reading stops once the closing '---' line has been
+    read. Text mode keeps the newline translation of a full read_text().
+    
+    Args:
+        file_path: Path to the markdown file
+        
+    Returns:
+        Leading text of the file, containing the closing delimiter if any
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read(FRONTMATTER_READ_SIZE)
+        if not content.startswith('---\n'):
+            return content
+        
+        searched = 4
+        while content.find('\n---\n', searched) == -1:
+            chunk = f.read(FRONTMATTER_READ_SIZE)
+            if not chunk:
+                break
+            # Resume just before the old end so a delimiter split across reads is found
+            searched = max(4, len(content) - 4)
+            content += chunk
+        return content
+
 def discover_content_files(base_dir: Path, content_dirs: List[str] = None) -> List[Path]:
     """
     Discover all markdown content files in specified directories.
@@ -222,16 +304,44 @@ def discover_content_files(base_dir: Path, content_dirs: List[str] = None) -> Li
         if not content_path.exists():
             continue
         
-        # Find all .md files recursively
-        for md_file in content_path.rglob('*.md'):
-            # Skip auto-generated files
-            if md_file.name.startswith('00_'):
-                continue
-            
-            markdown_files.append(md_file)
+        # Find all .md files recursively, skipping auto-generated files
+        markdown_files.extend(
+            md_file for md_file in _iter_markdown_files(content_path)
+            if not md_file.name.startswith('00_')
+        )
     
     return sorted(markdown_files)
 
+
+def _iter_markdown_files(directory: Path):
+    """
+    Recursively yield markdown files under a directory.
+    
+    Uses os.scandir, whose entries carry their file type, instead of
+    Path.rglob, which stats every entry on Python < 3.12. Directories are
+    walked as plain strings and NON_CONTENT_DIRS are pruned; only matches
+    become Path objects.
+    
+    Args:
+        directory: Directory to walk
+        
+    Yields:
+        Path objects for .md files
+    """
+    pending = [os.fspath(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.name not in NON_CONTENT_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        yield Path(entry.path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
 def validate_file_naming(file_path: Path) -> List[str]:
     """
     Validate file naming conventions based on core.md specifications.
@@ -242,36 +352,56 @@ def validate_file_naming(file_path: Path) -> List[str]:
     Returns:
         List of error messages
     """
-    errors = []
-    filename = file_path.name
+    return list(_file_naming_errors(file_path.name))
+
+@functools.lru_cache(maxsize=4096)
+def _file_naming_errors(filename: str) -> Tuple[str, ...]:
+    """
+    Naming convention errors for a file name, memoized per name.
+    
+    Names such as hw_01.md or 01_introduction.md recur across chapters.
+    
+    Args:
+        filename: File name to validate
+        
+    Returns:
+        Tuple of error messages
+    """
+    # Index files are valid names; a set lookup instead of the pattern checks
+    if filename in INDEX_FILENAMES:
+        return ()
     
     # Check for .md extension
     if not filename.endswith('.md'):
-        errors.append("Content files must have .md extension")
-        return errors
+        return ("Content files must have .md extension",)
     
     # Check naming pattern for content files
     # Should be: NN_descriptive_name.md or hw_NN.md
     name_without_ext = filename[:-3]
     
-    if name_without_ext.startswith('hw_'):
-        # Homework file - check pattern hw_NN
-        if not re.match(r'^hw_\d+$', name_without_ext):
-            errors.append("Homework files must follow pattern 'hw_NN.md' (e.g., hw_01.md)")
-    elif re.match(r'^[A-Z]_', name_without_ext):
-        # Appendix file - check pattern A_descriptive_name (capital letter prefix)
-        if not re.match(r'^[A-Z]_[a-z0-9_]+$', name_without_ext):
-            errors.append("Appendix files must follow pattern 'A_descriptive_name.md' with capital letter prefix")
-    elif re.match(r'^\d+_', name_without_ext):
-        # Primary content file - check pattern NN_descriptive_name
-        if not re.match(r'^\d{2}_[a-z0-9_]+$', name_without_ext):
-            errors.append("Content files must follow pattern 'NN_descriptive_name.md' with lowercase and underscores")
+    # The text before the first underscore picks the pattern that applies
+    prefix, underscore, _ = name_without_ext.partition('_')
+    
+    if underscore and prefix == 'hw':
+        # Homework file - pattern hw_NN
+        kind = 'homework'
+    elif underscore and len(prefix) == 1 and 'A' <= prefix <= 'Z':
+        # Appendix file - pattern A_descriptive_name (capital letter prefix)
+        kind = 'appendix'
+    elif underscore and prefix.isdecimal():
+        # Primary content file - pattern NN_descriptive_name
+        kind = 'numbered'
     else:
         # Could be code file or other - less strict
-        if not re.match(r'^[a-z0-9_]+$', name_without_ext):
-            errors.append("File names should use lowercase letters, numbers, and underscores only")
+        kind = 'plain'
+    
+    # One pass of the combined pattern; the name is valid only if the
+    # alternative that matched is the one its prefix calls for
+    match = FILE_NAME_PATTERN.fullmatch(name_without_ext)
+    if match is None or match.lastgroup != kind:
+        return (FILE_NAME_ERRORS[kind],)
     
-    return errors
+    return ()
 
 def generate_creation_based_slug(metadata: Dict[str, Any], existing_slugs: set) -> str:
     """
@@ -292,8 +422,8 @@ def generate_creation_based_slug(metadata: Dict[str, Any], existing_slugs: set)
     title = metadata['title']  # Required field
     
     # Sanitize title to max 25 chars, URL-safe
-    title_part = re.sub(r'[^\w\s-]', '', title.lower())
-    title_part = re.sub(r'[-\s]+', '-', title_part).strip('-')[:25]
+    title_part = SLUG_TITLE_STRIP_PATTERN.sub('', title.lower())
+    title_part = SLUG_TITLE_SEPARATOR_PATTERN.sub('-', title_part).strip('-')[:25]
     
     # Remove trailing hyphens that might result from truncation
     title_part = title_part.rstrip('-')
@@ -323,7 +453,7 @@ def validate_slug_format(slug: str) -> bool:
         return False
     
     # Check pattern: lowercase letters, numbers, hyphens only
-    return bool(SLUG_PATTERN.match(slug))
+    return bool(SLUG_PATTERN.fullmatch(slug))
 
 def get_all_slugs_from_files(content_files: List[Path]) -> set:
     """
@@ -336,11 +466,10 @@ def get_all_slugs_from_files(content_files: List[Path]) -> set:
         Set of existing slugs
     """
     existing_slugs = set()
-    parser = MetadataParser()
     
     for file_path in content_files:
         try:
-            metadata, errors, warnings = parser.parse_frontmatter(file_path)
+            metadata, errors, warnings = _DEFAULT_PARSER.parse_frontmatter(file_path)
             if 'slug' in metadata and isinstance(metadata['slug'], str):
                 existing_slugs.add(metadata['slug'])
         except Exception:
@@ -373,4 +502,4 @@ if __name__ == "__main__":
     console.print(Panel.fit("Content Metadata System", style="bold blue"))
     console.print(f"Required fields: {list(REQUIRED_FIELDS.keys())}")
     console.print(f"Optional fields: {list(OPTIONAL_FIELDS.keys())}")
-    console.print(f"Valid content types: {CONTENT_TYPES}") 
\ No newline at end of file
+    console.print(f"Valid content types: {list(CONTENT_TYPES)}") 
\ No newline at end of file
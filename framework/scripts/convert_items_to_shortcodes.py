@@ -16,6 +16,9 @@ import shutil
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# System directories never scanned for item blocks
+SKIP_DIRECTORIES = frozenset({'framework_code', 'hugo_generated', 'public'})
+
 class ItemBlockConverter:
     """Converts ITEM_START/ITEM_END blocks to Hugo shortcode calls"""
     
@@ -122,7 +125,7 @@ class ItemBlockConverter:
         for root, dirs, files in os.walk(directory):
             # Skip framework_code and other system directories
             root_path = Path(root)
-            if any(part.startswith('.') or part in ['framework_code', 'hugo_generated', 'public'] 
+            if any(part.startswith('.') or part in SKIP_DIRECTORIES
                    for part in root_path.parts):
                 continue
                 
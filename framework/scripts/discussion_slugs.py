@@ -8,8 +8,9 @@ Slugs are generated once from creation context and never change to maintain disc
 
 import sys
 import argparse
+from functools import cached_property
 from pathlib import Path
-from typing import List, Tuple, Set
+from typing import List, Optional, Tuple, Set
 
 from rich.console import Console
 from rich.panel import Panel
@@ -19,7 +20,7 @@ from rich.progress import Progress
 try:
     from content_metadata import (
         MetadataParser, discover_content_files,
-        generate_creation_based_slug, get_all_slugs_from_files, should_have_discussions,
+        generate_creation_based_slug, should_have_discussions,
         DISCUSSION_ENABLED_TYPES
     )
 except ImportError:
@@ -31,11 +32,23 @@ console = Console()
 class SlugManager:
     """Manages stable slug generation for discussions"""
     
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, files: Optional[List[Path]] = None):
+        """
+        Args:
+            base_dir: Base directory containing the content directories
+            files: Content files already discovered by the caller (skips the directory walk)
+        """
         self.base_dir = base_dir
         self.parser = MetadataParser()
         self.existing_slugs: Set[str] = set()
         self.files_with_generated_slugs: List[Tuple[Path, str]] = []
+        if files is not None:
+            self.content_files = files
+    
+    @cached_property
+    def content_files(self) -> List[Path]:
+        """Content files under base_dir, discovered once and shared by generate and audit"""
+        return discover_content_files(self.base_dir)
     
     def generate_missing_slugs(self, force: bool = False) -> bool:
         """Generate stable slugs for content missing them"""
@@ -47,7 +60,7 @@ class SlugManager:
         ))
         
         # Discover content files
-        content_files = discover_content_files(self.base_dir)
+        content_files = self.content_files
         
         if not content_files:
             console.print("[yellow]⚠️  No content files found[/yellow]")
@@ -55,17 +68,19 @@ class SlugManager:
         
         console.print(f"📄 Found {len(content_files)} content files")
         
-        # Get existing slugs
-        self.existing_slugs = get_all_slugs_from_files(content_files)
-        console.print(f"📋 Found {len(self.existing_slugs)} existing slugs")
-        
+        self.existing_slugs = set()
         files_needing_slugs = []
         
-        # Check which files need slugs
+        # One parse per file collects the existing slugs and finds the files needing one
         for file_path in content_files:
             try:
                 metadata, errors, warnings = self.parser.parse_frontmatter(file_path)
                 
+                # Every file's slug is taken, including files with errors
+                slug = metadata.get('slug')
+                if isinstance(slug, str):
+                    self.existing_slugs.add(slug)
+                
                 # Skip files with errors in required fields
                 if errors:
                     continue
@@ -85,6 +100,8 @@ class SlugManager:
                 console.print(f"[yellow]⚠️  Could not process {file_path}: {e}[/yellow]")
                 continue
         
+        console.print(f"📋 Found {len(self.existing_slugs)} existing slugs")
+        
         if not files_needing_slugs:
             console.print("✅ All discussion-enabled content already has stable slugs")
             return True
@@ -136,7 +153,7 @@ class SlugManager:
         ))
         
         # Discover content files
-        content_files = discover_content_files(self.base_dir)
+        content_files = self.content_files
         
         if not content_files:
             console.print("[yellow]⚠️  No content files found[/yellow]")
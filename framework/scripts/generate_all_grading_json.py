@@ -223,8 +223,15 @@ class GradingJSONGenerator:
         return True
 
 
-def main():
-    """Main function for standalone execution"""
+def main(argv=None) -> int:
+    """Main function for standalone execution
+    
+    Args:
+        argv: Command line arguments (unused; accepted for in-process runs)
+        
+    Returns:
+        int: Exit code (0 on success)
+    """
     console = Console()
     
     # Determine project root
@@ -10,9 +10,24 @@ Now includes optional content validation before Hugo config generation.
 import os
 import sys
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from jinja2 import Environment, BaseLoader
 
+# Prefer the libyaml-backed loader; the pure-Python SafeLoader is several times slower
+try:
+    from yaml import CSafeLoader as _Loader
+    _HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _Loader
+    _HAS_LIBYAML = False
+
+# CI containers can set HUGO_REQUIRE_LIBYAML=1 so a silent fallback fails the build instead
+if os.environ.get("HUGO_REQUIRE_LIBYAML") == "1" and not _HAS_LIBYAML:
+    print("❌ HUGO_REQUIRE_LIBYAML=1 but PyYAML was built without libyaml (CSafeLoader missing)")
+    print("   Reinstall PyYAML against libyaml, e.g.: apt-get install libyaml-dev && pip install --no-binary pyyaml pyyaml")
+    sys.exit(2)
+
 # Import validation system (optional, handle different execution contexts)
 try:
     from validate_content import ContentValidator, load_validation_config
@@ -63,20 +78,31 @@ except ImportError:
     except ImportError:
         ITEM_PARSING_AVAILABLE = False
 
-def load_yaml_file(file_path):
-    """Load and parse a YAML file, return empty dict if file doesn't exist."""
+def load_yaml_file(file_path, messages=None):
+    """Load and parse a YAML file, return empty dict if file doesn't exist.
+    
+    Args:
+        file_path: YAML file to load
+        messages: List collecting warnings instead of printing them, if given
+    """
+    report = print if messages is None else messages.append
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_Loader) or {}
     except FileNotFoundError:
-        print(f"Warning: {file_path} not found, using defaults")
+        report(f"Warning: {file_path} not found, using defaults")
         return {}
     except yaml.YAMLError as e:
-        print(f"Error parsing {file_path}: {e}")
+        report(f"Error parsing {file_path}: {e}")
         return {}
 
-def merge_config_data(base_dir):
-    """Merge configuration data from rendering-related YAML files only."""
+def merge_config_data(base_dir, messages=None):
+    """Merge configuration data from rendering-related YAML files only.
+    
+    Args:
+        base_dir: Directory holding config.yml
+        messages: List collecting warnings instead of printing them, if given
+    """
     
     # Load only rendering configuration files - NO dna.yml dependency
     # NEW: course.yml is now in class_template directory
@@ -84,8 +110,8 @@ def merge_config_data(base_dir):
     course_path = repo_root / "class_template" / "course.yml"
     config_path = base_dir / "config.yml"
     
-    course_data = load_yaml_file(course_path)
-    config_data = load_yaml_file(config_path)
+    course_data = load_yaml_file(course_path, messages)
+    config_data = load_yaml_file(config_path, messages)
     
     # Merge configuration data (config.yml takes precedence for conflicts)
     merged_data = {}
@@ -116,28 +142,35 @@ def bool_to_toml(value):
     else:
         return str(value).lower()
 
-def generate_hugo_config(base_dir):
-    """Generate hugo.toml from template and configuration data."""
+def render_hugo_config(base_dir, messages=None):
+    """Render hugo.toml content from template and configuration data without writing it.
     
-    # NEW: Generate to root-level hugo_generated/ directory
+    Reads only the YAML configs and the template, never content files, so it can
+    run alongside content validation. Pass messages when running it on another
+    thread, so its output is printed afterwards instead of interleaving.
+    
+    Args:
+        base_dir: Directory holding config.yml
+        messages: List collecting warnings and errors instead of printing them, if given
+    
+    Returns:
+        str: Rendered hugo.toml, or None on failure
+    """
+    
+    report = print if messages is None else messages.append
     repo_root = Path(__file__).parent.parent.parent  # framework/scripts/ -> repo root
     template_path = repo_root / "framework" / "hugo_config" / "hugo.toml.j2"
     
-    # Output to root-level hugo_generated directory (single build target)
-    hugo_generated_dir = repo_root / "hugo_generated"
-    hugo_generated_dir.mkdir(exist_ok=True)
-    output_path = hugo_generated_dir / "hugo.toml"
-    
     # Load template
     try:
         with open(template_path, 'r', encoding='utf-8') as f:
             template_content = f.read()
     except FileNotFoundError:
-        print(f"Error: Template file {template_path} not found")
-        return False
+        report(f"Error: Template file {template_path} not found")
+        return None
     
     # Merge configuration data (self-contained)
-    config_data = merge_config_data(base_dir)
+    config_data = merge_config_data(base_dir, messages)
     
     # Add computed values for framework structure - NEW: Use correct root-level paths
     # These values provide defaults for the template variables to ensure consistent paths
@@ -161,10 +194,31 @@ def generate_hugo_config(base_dir):
     template = env.from_string(template_content)
     
     try:
-        rendered_content = template.render(**config_data)
+        return template.render(**config_data)
     except Exception as e:
-        print(f"Error rendering template: {e}")
-        return False
+        report(f"Error rendering template: {e}")
+        return None
+
+def generate_hugo_config(base_dir, rendered_content=None):
+    """Generate hugo.toml from template and configuration data.
+    
+    Args:
+        base_dir: Directory holding config.yml
+        rendered_content: Output of render_hugo_config when already rendered
+    """
+    
+    if rendered_content is None:
+        rendered_content = render_hugo_config(base_dir)
+        if rendered_content is None:
+            return False
+    
+    # NEW: Generate to root-level hugo_generated/ directory
+    repo_root = Path(__file__).parent.parent.parent  # framework/scripts/ -> repo root
+    
+    # Output to root-level hugo_generated directory (single build target)
+    hugo_generated_dir = repo_root / "hugo_generated"
+    hugo_generated_dir.mkdir(exist_ok=True)
+    output_path = hugo_generated_dir / "hugo.toml"
     
     # Write the generated hugo.toml
     try:
@@ -237,16 +291,18 @@ def run_index_generation(base_dir: Path) -> bool:
     config = {'index_generation': True}
     
     for dna_path in dna_paths:
-        if dna_path.exists():
-            try:
-                with open(dna_path, 'r') as f:
-                    dna_config = yaml.safe_load(f) or {}
-                if 'index_generation' in dna_config:
-                    config['index_generation'] = bool(dna_config['index_generation'])
-                break  # Use the first found dna.yml
-            except Exception as e:
-                print(f"⚠️  Could not read {dna_path}: {e}")
-                continue
+        # Opening directly answers "does it exist" without a separate stat
+        try:
+            with open(dna_path, 'r') as f:
+                dna_config = yaml.load(f, Loader=_Loader) or {}
+            if 'index_generation' in dna_config:
+                config['index_generation'] = bool(dna_config['index_generation'])
+            break  # Use the first found dna.yml
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"⚠️  Could not read {dna_path}: {e}")
+            continue
     
     if not config.get('index_generation', True):
         print("📚 Index generation disabled in configuration")
@@ -287,16 +343,18 @@ def run_item_parsing(base_dir):
     config = {'homework_parsing': True}  # Default enabled for grading system
     
     for dna_path in dna_paths:
-        if dna_path.exists():
-            try:
-                with open(dna_path, 'r') as f:
-                    dna_config = yaml.safe_load(f) or {}
-                if 'homework_parsing' in dna_config:
-                    config['homework_parsing'] = bool(dna_config['homework_parsing'])
-                break  # Use the first found dna.yml
-            except Exception as e:
-                print(f"⚠️  Could not read {dna_path}: {e}")
-                continue
+        # Opening directly answers "does it exist" without a separate stat
+        try:
+            with open(dna_path, 'r') as f:
+                dna_config = yaml.load(f, Loader=_Loader) or {}
+            if 'homework_parsing' in dna_config:
+                config['homework_parsing'] = bool(dna_config['homework_parsing'])
+            break  # Use the first found dna.yml
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"⚠️  Could not read {dna_path}: {e}")
+            continue
     
     if not config.get('homework_parsing', True):
         print("📝 Homework parsing disabled in configuration")
@@ -383,11 +441,21 @@ def run_homework_processing(base_dir: Path) -> bool:
         # Don't fail build on processing errors (graceful degradation)
         return True
 
-def main():
-    """Main entry point - works from any self-contained directory."""
+def main(argv=None) -> int:
+    """Main entry point - works from any self-contained directory.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: Exit code (0 on success)
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
     # Work from current directory (self-contained approach)
-    if len(sys.argv) > 1:
-        base_dir = Path(sys.argv[1])
+    if argv:
+        base_dir = Path(argv[0])
     else:
         base_dir = Path.cwd()
     
@@ -398,37 +466,54 @@ def main():
     repo_root = Path.cwd().parent if Path.cwd().name in ['professor', 'students'] else Path.cwd()
     template_file = repo_root / "framework" / "hugo_config" / "hugo.toml.j2"
     
-    if not template_file.exists():
+    # Single stat call; FileNotFoundError doubles as the existence check
+    try:
+        os.stat(template_file)
+    except FileNotFoundError:
         print(f"Error: Not in a valid project directory. Missing {template_file}")
         print("This script must be run from a directory with access to framework/")
-        sys.exit(1)
+        return 1
     
     print(f"🔧 Generating self-contained Hugo configuration from {base_dir}")
     
     # Run automatic index generation first
     if not run_index_generation(base_dir):
         print("❌ Build aborted due to index generation failures")
-        sys.exit(1)
+        return 1
     
     # Run homework parsing after index generation
     if not run_item_parsing(base_dir):
         print("❌ Build aborted due to homework parsing failures")
-        sys.exit(1)
+        return 1
     
     # Skip homework content processing - keep source files clean
     # Beautiful UI is generated by CSS and Hugo templates at render time
     # run_homework_processing(base_dir)
     
-    # Run content validation after homework parsing
-    if not run_content_validation(base_dir):
+    # Run content validation after homework parsing. Rendering hugo.toml does not
+    # depend on content, so it overlaps validation; the file is only written once
+    # validation has passed. The render thread collects its messages rather than
+    # printing them over the validation output.
+    render_messages = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        render_future = executor.submit(render_hugo_config, base_dir, render_messages)
+        validation_passed = run_content_validation(base_dir)
+        rendered_content = render_future.result()
+    
+    for message in render_messages:
+        print(message)
+    
+    if not validation_passed:
         print("❌ Build aborted due to content validation failures")
-        sys.exit(1)
+        return 1
     
-    if generate_hugo_config(base_dir):
+    if rendered_content is not None and generate_hugo_config(base_dir, rendered_content):
         print("✅ Hugo configuration generated successfully")
     else:
         print("❌ Failed to generate Hugo configuration")
-        sys.exit(1)
+        return 1
+    
+    return 0
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file
@@ -18,6 +18,8 @@ Features:
     - Incremental updates based on content changes
 """
 
+import functools
+import os
 import sys
 import hashlib
 from pathlib import Path
@@ -51,9 +53,52 @@ except ImportError:
 
 console = Console()
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def _chapter_name_order(name: str) -> Tuple:
+    """Ordering of a chapter directory name, memoized per name
+    
+    Returns:
+        tuple: (group, order) where group 0 is numbered chapters and 1 is appendices;
+            order is the chapter number, the appendix letter, or 999
+    """
+    # Handle appendix chapters (A_, B_, etc.)
+    if name[0].isupper() and name[0].isalpha():
+        return (1, name[0])  # Appendices come after numbered chapters
+    
+    # Handle numbered chapters (01_, 02_, etc.)
+    if name[:2].isdigit():
+        return (0, int(name[:2]))
+    
+    # Fallback for other naming patterns
+    return (0, 999)
+
+@functools.lru_cache(maxsize=4096)
+def _file_name_order(stem: str) -> Tuple[int, int]:
+    """Ordering of a content file name without extension, memoized per name
+    
+    Returns:
+        tuple: (group, order) where group 0 is numbered content, 1 other files
+            and 2 homework; order is the section or homework number, or 999
+    """
+    # Handle homework files (hw_01, hw_02, etc.)
+    if stem.startswith('hw_'):
+        if stem[3:].isdigit():
+            return (2, int(stem[3:]))  # Homework comes after content
+        return (2, 999)
+    
+    # Handle numbered content files (01_, 02_, etc.)
+    if stem[:2].isdigit():
+        return (0, int(stem[:2]))
+    
+    # Fallback for other patterns
+    return (1, 999)
+
+@dataclass(slots=True)
 class ContentFile:
-    """Represents a content file with metadata and path information"""
+    """Represents a content file with metadata and path information
+    
+    One instance per content file, so slots instead of a per-instance __dict__.
+    """
     path: Path
     relative_path: Path
     filename: str
@@ -74,6 +119,7 @@ class Chapter:
     files: List[ContentFile]
     index_path: Path
     needs_update: bool = True
+    homework_count: int = 0
 
 @dataclass
 class ContentCategory:
@@ -84,6 +130,8 @@ class ContentCategory:
     chapters: List[Chapter]
     master_index_path: Path
     needs_update: bool = True
+    file_count: int = 0
+    homework_count: int = 0
 
 class ContentStructureAnalyzer:
     """Analyzes content directory structure and organizes files"""
@@ -93,10 +141,14 @@ class ContentStructureAnalyzer:
         self.parser = MetadataParser()
         self.content_categories = []
         
-    def analyze_structure(self) -> List[ContentCategory]:
+    def analyze_structure(self, content_dirs: List[str] = None) -> List[ContentCategory]:
         """
         Analyze the complete content structure.
         
+        Args:
+            content_dirs: Category directories to analyze (default: the standard
+                content directories); pass the known layout to skip absent ones
+        
         Returns:
             List of ContentCategory objects with organized content
         """
@@ -107,24 +159,34 @@ class ContentStructureAnalyzer:
         ))
         
         # Standard content directories
-        content_dirs = ['framework_tutorials', 'framework_documentation', 'class_notes']
+        if content_dirs is None:
+            content_dirs = ['framework_tutorials', 'framework_documentation', 'class_notes']
         
         categories = []
         
         for content_dir in content_dirs:
             content_path = self.base_dir / content_dir
-            if not content_path.exists():
+            # The listing doubles as the existence check and is handed to the category scan
+            try:
+                with os.scandir(content_path) as it:
+                    entries = list(it)
+            except (FileNotFoundError, NotADirectoryError):
                 console.print(f"[yellow]⚠️  Directory {content_dir} not found, skipping[/yellow]")
                 continue
             
-            category = self._analyze_category(content_path)
+            category = self._analyze_category(content_path, entries)
             if category:
                 categories.append(category)
         
         return categories
     
-    def _analyze_category(self, category_path: Path) -> Optional[ContentCategory]:
-        """Analyze a single content category directory"""
+    def _analyze_category(self, category_path: Path, entries: List[os.DirEntry]) -> Optional[ContentCategory]:
+        """Analyze a single content category directory
+        
+        Args:
+            category_path: Category directory path
+            entries: Directory entries of category_path, as already listed by the caller
+        """
         
         category_name = category_path.name
         category_title = self._generate_category_title(category_name)
@@ -133,8 +195,9 @@ class ContentStructureAnalyzer:
         
         # Find chapter directories
         chapters = []
-        chapter_dirs = [d for d in category_path.iterdir() 
-                       if d.is_dir() and not d.name.startswith('.')]
+        # DirEntry.is_dir() reuses the type from the directory listing instead of a stat per entry
+        chapter_dirs = [Path(entry.path) for entry in entries
+                       if not entry.name.startswith('.') and entry.is_dir()]
         
         if not chapter_dirs:
             console.print(f"[yellow]No chapter directories found in {category_name}[/yellow]")
@@ -159,7 +222,9 @@ class ContentStructureAnalyzer:
             name=category_name,
             title=category_title,
             chapters=chapters,
-            master_index_path=master_index_path
+            master_index_path=master_index_path,
+            file_count=sum(len(chapter.files) for chapter in chapters),
+            homework_count=sum(chapter.homework_count for chapter in chapters)
         )
     
     def _analyze_chapter(self, chapter_path: Path, category_path: Path) -> Optional[Chapter]:
@@ -170,20 +235,31 @@ class ContentStructureAnalyzer:
         
         # Find content files (exclude existing indices)
         content_files = []
-        md_files = [f for f in chapter_path.glob('*.md') 
-                   if not f.name.startswith('00_')]
+        with os.scandir(chapter_path) as entries:
+            # Plain (name, path) strings; a Path is only built per file once it is analyzed
+            md_files = [(entry.name, entry.path) for entry in entries
+                       if entry.name.endswith('.md') and not entry.name.startswith('00_')
+                       and entry.is_file()]
         
         if not md_files:
             console.print(f"    [yellow]No content files found[/yellow]")
             return None
         
         # Sort files by naming convention
-        md_files.sort(key=self._file_sort_key)
+        md_files.sort(key=lambda md_file: self._file_sort_key(md_file[0]))
         
-        for md_file in md_files:
-            content_file = self._analyze_content_file(md_file, chapter_path, category_path)
+        # Chapter facts shared by every file, derived once instead of per file
+        chapter_order = self._extract_chapter_order(chapter_name)
+        is_appendix = chapter_name[0].isupper() and chapter_name[0].isalpha()
+        relative_dir = chapter_path.relative_to(self.base_dir)
+        
+        homework_count = 0
+        for filename, file_path in md_files:
+            content_file = self._analyze_content_file(Path(file_path), filename, relative_dir,
+                                                      chapter_order, is_appendix)
             if content_file:
                 content_files.append(content_file)
+                homework_count += content_file.is_homework
         
         if not content_files:
             console.print(f"    [yellow]No valid content files found[/yellow]")
@@ -191,8 +267,6 @@ class ContentStructureAnalyzer:
         
         # Extract chapter metadata
         chapter_title = self._generate_chapter_title(chapter_name, content_files)
-        chapter_order = self._extract_chapter_order(chapter_name)
-        is_appendix = chapter_name[0].isupper() and chapter_name[0].isalpha()
         
         index_path = chapter_path / "00_index.md"
         
@@ -205,29 +279,36 @@ class ContentStructureAnalyzer:
             order=chapter_order,
             is_appendix=is_appendix,
             files=content_files,
-            index_path=index_path
+            index_path=index_path,
+            homework_count=homework_count
         )
     
-    def _analyze_content_file(self, file_path: Path, chapter_path: Path, category_path: Path) -> Optional[ContentFile]:
-        """Analyze a single content file"""
+    def _analyze_content_file(self, file_path: Path, filename: str, relative_dir: Path,
+                              chapter_order: int, is_appendix: bool) -> Optional[ContentFile]:
+        """Analyze a single content file
+        
+        Args:
+            file_path: Content file path
+            filename: Name of the content file
+            relative_dir: Chapter directory relative to the base directory
+            chapter_order: Order of the containing chapter
+            is_appendix: Whether the containing chapter is an appendix
+        """
         
         # Parse metadata
         metadata, errors, warnings = self.parser.parse_frontmatter(file_path)
         
         if errors:
-            console.print(f"    [red]⚠️  {file_path.name}: {len(errors)} metadata errors[/red]")
+            console.print(f"    [red]⚠️  {filename}: {len(errors)} metadata errors[/red]")
             # Continue processing even with errors (graceful degradation)
         
-        # Calculate relative path
-        relative_path = file_path.relative_to(self.base_dir)
+        # Relative path from the chapter's, without a per-file relative_to()
+        relative_path = relative_dir / filename
         
         # Determine file characteristics
-        filename = file_path.name
         is_homework = filename.startswith('hw_')
-        is_appendix = chapter_path.name[0].isupper() and chapter_path.name[0].isalpha()
         
         # Extract ordering information
-        chapter_order = self._extract_chapter_order(chapter_path.name)
         section_order = self._extract_section_order(filename)
         
         return ContentFile(
@@ -244,49 +325,21 @@ class ContentStructureAnalyzer:
     def _chapter_sort_key(self, chapter_dir: Path) -> Tuple:
         """Generate sort key for chapter directories"""
         name = chapter_dir.name
-        
-        # Handle appendix chapters (A_, B_, etc.)
-        if name[0].isupper() and name[0].isalpha():
-            return (1, name[0], name)  # Appendices come after numbered chapters
-        
-        # Handle numbered chapters (01_, 02_, etc.)
-        if name[:2].isdigit():
-            return (0, int(name[:2]), name)
-        
-        # Fallback for other naming patterns
-        return (0, 999, name)
+        return _chapter_name_order(name) + (name,)
     
-    def _file_sort_key(self, file_path: Path) -> Tuple:
-        """Generate sort key for content files"""
-        name = file_path.stem
-        
-        # Handle homework files (hw_01, hw_02, etc.)
-        if name.startswith('hw_'):
-            if name[3:].isdigit():
-                return (2, int(name[3:]), name)  # Homework comes after content
-            return (2, 999, name)
-        
-        # Handle numbered content files (01_, 02_, etc.)
-        if name[:2].isdigit():
-            return (0, int(name[:2]), name)
-        
-        # Fallback for other patterns
-        return (1, 999, name)
+    def _file_sort_key(self, filename: str) -> Tuple:
+        """Generate sort key for content file names"""
+        name = os.path.splitext(filename)[0]
+        return _file_name_order(name) + (name,)
     
     def _extract_chapter_order(self, chapter_name: str) -> int:
         """Extract numeric order from chapter directory name"""
-        if chapter_name[:2].isdigit():
-            return int(chapter_name[:2])
-        return 999  # Appendices and special chapters
+        group, order = _chapter_name_order(chapter_name)
+        return order if group == 0 else 999  # Appendices and special chapters
     
     def _extract_section_order(self, filename: str) -> int:
         """Extract numeric order from content file name"""
-        name = Path(filename).stem
-        if name[:2].isdigit():
-            return int(name[:2])
-        if name.startswith('hw_') and name[3:].isdigit():
-            return int(name[3:])
-        return 999
+        return _file_name_order(os.path.splitext(filename)[0])[1]
     
     def _generate_category_title(self, category_name: str) -> str:
         """Generate human-readable title for content category"""
@@ -318,9 +371,23 @@ class ContentStructureAnalyzer:
 class IndexGenerator:
     """Generates index files based on content structure analysis"""
     
-    def __init__(self, base_dir: Path):
+    # Badge emoji per difficulty level, shared by every index entry
+    _DIFFICULTY_EMOJI = {
+        'easy': '🟢',
+        'medium': '🟡',
+        'hard': '🔴'
+    }
+    
+    # Closing lines of generated chapter and master indices
+    _CHAPTER_INDEX_FOOTER = ("---", "", "*This index was automatically generated. Do not edit manually.*")
+    _MASTER_INDEX_FOOTER = ("---", "", "*This master index was automatically generated. Do not edit manually.*")
+    
+    def __init__(self, base_dir: Path, content_dirs: List[str] = None):
         self.base_dir = base_dir
+        self.content_dirs = content_dirs
         self.analyzer = ContentStructureAnalyzer(base_dir)
+        # Every index written by this generator carries the same date stamp
+        self.current_date = datetime.now().strftime('%Y-%m-%d')
     
     def generate_all_indices(self) -> bool:
         """
@@ -336,7 +403,7 @@ class IndexGenerator:
         ))
         
         # Analyze content structure
-        categories = self.analyzer.analyze_structure()
+        categories = self.analyzer.analyze_structure(self.content_dirs)
         
         if not categories:
             console.print("[yellow]⚠️  No content categories found for index generation[/yellow]")
@@ -402,13 +469,11 @@ class IndexGenerator:
         """Create the content for a chapter index file"""
         
         # Header with metadata
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        
         content = []
         content.append("---")
         content.append(f'title: "{chapter.title}"')
         content.append('type: "index"')
-        content.append(f'date: "{current_date}"')
+        content.append(f'date: "{self.current_date}"')
         content.append('author: "Framework (Auto-generated)"')
         content.append(f'summary: "Index for {chapter.title} chapter"')
         content.append("---")
@@ -419,8 +484,7 @@ class IndexGenerator:
         content.append("")
         
         # Separate content files by type
-        regular_files = [f for f in chapter.files if not f.is_homework]
-        homework_files = [f for f in chapter.files if f.is_homework]
+        regular_files, homework_files = self._split_homework(chapter)
         
         # Main content section
         if regular_files:
@@ -444,9 +508,7 @@ class IndexGenerator:
         content.extend(self._create_chapter_navigation(chapter, category))
         
         # Footer
-        content.append("---")
-        content.append("")
-        content.append("*This index was automatically generated. Do not edit manually.*")
+        content.extend(self._CHAPTER_INDEX_FOOTER)
         
         return "\n".join(content)
     
@@ -471,12 +533,7 @@ class IndexGenerator:
         # Difficulty badge
         difficulty = file.metadata.get('difficulty', '')
         if difficulty:
-            difficulty_emoji = {
-                'easy': '🟢',
-                'medium': '🟡', 
-                'hard': '🔴'
-            }
-            emoji = difficulty_emoji.get(difficulty, '⚪')
+            emoji = self._DIFFICULTY_EMOJI.get(difficulty, '⚪')
             badges.append(f"{emoji} **{difficulty.title()}**")
         
         # Estimated time
@@ -515,12 +572,7 @@ class IndexGenerator:
         # Difficulty
         difficulty = file.metadata.get('difficulty', '')
         if difficulty:
-            difficulty_emoji = {
-                'easy': '🟢',
-                'medium': '🟡',
-                'hard': '🔴'
-            }
-            emoji = difficulty_emoji.get(difficulty, '⚪')
+            emoji = self._DIFFICULTY_EMOJI.get(difficulty, '⚪')
             badges.append(f"{emoji} **{difficulty.title()}**")
         
         # Estimated time (important for homework)
@@ -591,13 +643,11 @@ class IndexGenerator:
         """Create the content for a master index file"""
         
         # Header with metadata
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        
         content = []
         content.append("---")
         content.append(f'title: "{category.title}"')
         content.append('type: "master-index"')
-        content.append(f'date: "{current_date}"')
+        content.append(f'date: "{self.current_date}"')
         content.append('author: "Framework (Auto-generated)"')
         content.append(f'summary: "Master index for {category.title} content"')
         content.append("---")
@@ -614,10 +664,12 @@ class IndexGenerator:
         content.append(overview_text)
         content.append("")
         
-        # Statistics
-        total_files = sum(len(chapter.files) for chapter in category.chapters)
-        homework_count = sum(len([f for f in chapter.files if f.is_homework]) for chapter in category.chapters)
-        regular_count = total_files - homework_count
+        # Split each chapter once; chapter entries and the homework overview share it
+        chapter_files = {chapter.name: self._split_homework(chapter) for chapter in category.chapters}
+        
+        # Statistics, counted during structure analysis
+        homework_count = category.homework_count
+        regular_count = category.file_count - homework_count
         
         content.append("## 📊 Content Statistics")
         content.append("")
@@ -636,7 +688,7 @@ class IndexGenerator:
             content.append("")
             
             for chapter in regular_chapters:
-                content.extend(self._format_chapter_entry(chapter))
+                content.extend(self._format_chapter_entry(chapter, *chapter_files[chapter.name]))
                 content.append("")
         
         # Appendices section
@@ -645,7 +697,7 @@ class IndexGenerator:
             content.append("")
             
             for chapter in appendix_chapters:
-                content.extend(self._format_chapter_entry(chapter))
+                content.extend(self._format_chapter_entry(chapter, *chapter_files[chapter.name]))
                 content.append("")
         
         # Homework overview
@@ -654,7 +706,7 @@ class IndexGenerator:
             content.append("")
             
             for chapter in category.chapters:
-                homework_files = [f for f in chapter.files if f.is_homework]
+                _, homework_files = chapter_files[chapter.name]
                 if homework_files:
                     content.append(f"### {chapter.title}")
                     for file in homework_files:
@@ -663,9 +715,7 @@ class IndexGenerator:
                     content.append("")
         
         # Footer
-        content.append("---")
-        content.append("")
-        content.append("*This master index was automatically generated. Do not edit manually.*")
+        content.extend(self._MASTER_INDEX_FOOTER)
         
         return "\n".join(content)
     
@@ -683,8 +733,15 @@ class IndexGenerator:
         
         return overviews.get(category.name, f"Content for {category.title}.")
     
-    def _format_chapter_entry(self, chapter: Chapter) -> List[str]:
-        """Format a chapter entry for the master index"""
+    def _format_chapter_entry(self, chapter: Chapter, regular_files: List[ContentFile],
+                              homework_files: List[ContentFile]) -> List[str]:
+        """Format a chapter entry for the master index
+        
+        Args:
+            chapter: Chapter to format
+            regular_files: The chapter's non-homework files
+            homework_files: The chapter's homework files
+        """
         
         entry = []
         
@@ -698,9 +755,6 @@ class IndexGenerator:
             entry.append("")
         
         # Chapter statistics
-        regular_files = [f for f in chapter.files if not f.is_homework]
-        homework_files = [f for f in chapter.files if f.is_homework]
-        
         stats = []
         if regular_files:
             stats.append(f"{len(regular_files)} content files")
@@ -717,17 +771,21 @@ class IndexGenerator:
             for file in regular_files:
                 title = file.metadata.get('title', file.filename)
                 difficulty = file.metadata.get('difficulty', '')
-                difficulty_emoji = {
-                    'easy': '🟢',
-                    'medium': '🟡',
-                    'hard': '🔴'
-                }.get(difficulty, '')
+                difficulty_emoji = self._DIFFICULTY_EMOJI.get(difficulty, '')
                 
                 difficulty_badge = f" {difficulty_emoji}" if difficulty_emoji else ""
                 entry.append(f"- [{title}]({chapter.name}/{file.filename}){difficulty_badge}")
         
         return entry
     
+    def _split_homework(self, chapter: Chapter) -> Tuple[List[ContentFile], List[ContentFile]]:
+        """Split a chapter's files into (regular_files, homework_files), keeping order"""
+        # One pass, indexing the target list by the homework flag
+        buckets = ([], [])
+        for f in chapter.files:
+            buckets[f.is_homework].append(f)
+        return buckets
+    
     def _get_chapter_summary(self, chapter: Chapter) -> str:
         """Get or generate a summary for a chapter"""
         
@@ -758,16 +816,18 @@ def load_index_config(base_dir: Path) -> Dict:
         'force_regeneration': False
     }
     
-    if dna_path.exists():
-        try:
-            with open(dna_path, 'r') as f:
-                dna_config = yaml.safe_load(f) or {}
+    # Opening directly answers "does it exist" without a separate stat
+    try:
+        with open(dna_path, 'r') as f:
+            dna_config = yaml.safe_load(f) or {}
+        
+        if 'index_generation' in dna_config:
+            config['index_generation'] = bool(dna_config['index_generation'])
             
-            if 'index_generation' in dna_config:
-                config['index_generation'] = bool(dna_config['index_generation'])
-                
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not read dna.yml: {e}[/yellow]")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not read dna.yml: {e}[/yellow]")
     
     return config
 
@@ -790,6 +850,12 @@ def main():
         action='store_true',
         help='Force regeneration of all indices'
     )
+    parser.add_argument(
+        '--content-dirs',
+        nargs='+',
+        metavar='DIR',
+        help='Content directories to index (default: framework_tutorials, framework_documentation, class_notes)'
+    )
     
     args = parser.parse_args()
     
@@ -811,7 +877,7 @@ def main():
     
     try:
         # Run index generation
-        generator = IndexGenerator(base_dir)
+        generator = IndexGenerator(base_dir, args.content_dirs)
         success = generator.generate_all_indices()
         
         # Exit with appropriate code
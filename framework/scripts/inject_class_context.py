@@ -403,14 +403,24 @@ document.addEventListener('DOMContentLoaded', function() {{
             return False
 
 
-def main():
-    """Main function for standalone execution"""
+def main(argv=None) -> int:
+    """Main function for standalone execution
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: Exit code (0 on success)
+    """
     import sys
     
+    if argv is None:
+        argv = sys.argv[1:]
+    
     console = Console()
     
     # Get target directory from command line or default to professor
-    target_directory = sys.argv[1] if len(sys.argv) > 1 else "professor"
+    target_directory = argv[0] if argv else "professor"
     
     # Determine project root
     project_root = Path.cwd()
@@ -9,41 +9,106 @@ Usage Examples:
   ./manage.py --sync           # Sync updates (students only)
   ./manage.py --deploy         # Production deployment
   ./manage.py --publish        # Complete build + deploy
-  ./manage.py --build --dev    # Build and start dev server
+  ./manage.py --build --dev    # Generate and start dev server
   ./manage.py --build --deploy # Build and deploy (same as --publish)
   ./manage.py --sync --build   # Sync and build (students)
   ./manage.py --status         # Show current state
 """
 
-import argparse
+import functools
+import heapq
+import itertools
 import os
+import re
 import sys
 import subprocess
-import json
 import time
-import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import List
 
+# Only the console is imported eagerly; widgets (tables, panels, progress) are
+# imported where they are used so short commands skip their import cost
 try:
     from rich.console import Console
-    from rich.panel import Panel
-    from rich.prompt import Confirm, Prompt
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.table import Table
-    from rich.text import Text
-    from rich.syntax import Syntax
-    from rich.layout import Layout
-    from rich import print as rprint
 except ImportError:
     print("❌ Missing required 'rich' library. Install with: pip install rich")
     sys.exit(1)
 
-console = Console()
+# Opening/closing rich markup tags, e.g. [bold], [/red]; escaped tags (\[...]) are kept
+_MARKUP_TAG = re.compile(r"(?<!\\)\[/?[a-z#@][^\[\]]*\]")
+
+class _PlainConsole(Console):
+    """Console for non-terminal output (CI logs, pipes)
+    
+    Plain strings have their markup tags stripped and are written directly,
+    skipping rich's markup parsing and rendering; tables and other renderables
+    still go through rich.
+    """
+    
+    def print(self, *objects, sep=" ", end="\n", **kwargs):
+        if not objects or not all(isinstance(obj, str) for obj in objects):
+            return super().print(*objects, sep=sep, end=end, **kwargs)
+        if kwargs.get('markup', True):
+            objects = [_MARKUP_TAG.sub("", obj).replace("\\[", "[") for obj in objects]
+        try:
+            print(*objects, sep=sep, end=end, file=self.file, flush=True)
+        except BrokenPipeError:
+            # Reader went away (e.g. piped into head); exit quietly like rich does
+            self.on_broken_pipe()
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Shared console, created on first use"""
+    if sys.stdout.isatty():
+        return Console(highlight=False)
+    return _PlainConsole(highlight=False, emoji=False, no_color=True)
+
+def _entry_names(directory: Path) -> set:
+    """Names of the entries in a directory, read with a single scandir call
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        set: Entry names (empty if the directory does not exist)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def _scan_recent(root: str, cutoff_ns: int):
+    """Recursively yield markdown files modified after a cutoff
+    
+    Walks with os.scandir so each file is stat'ed once through its DirEntry;
+    symlinks are not followed.
+    
+    Args:
+        root: Directory to scan
+        cutoff_ns: Modification time (epoch nanoseconds) files must be newer than
+        
+    Yields:
+        tuple: (path string, st_mtime_ns) for each recently modified .md file
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_recent(entry.path, cutoff_ns)
+                elif entry.name.endswith(".md"):
+                    # Integer nanoseconds: no float conversion in the comparison
+                    mtime_ns = entry.stat().st_mtime_ns
+                    if mtime_ns > cutoff_ns:
+                        yield entry.path, mtime_ns
+    except PermissionError:
+        pass
 
 class FrameworkManager:
     def __init__(self):
-        self.console = console
+        self.console = _console()
         self.env_manager = EnvironmentManager(self.console)
         self.subprocess_runner = SubprocessRunner(self.console)
         self.message_orchestrator = MessageOrchestrator(self.console)
@@ -145,6 +210,7 @@ class FrameworkManager:
     
     def show_status(self):
         """Show current framework status"""
+        from rich.table import Table
         
         # Create status table
         table = Table(title="Framework Status", show_header=True, header_style="bold magenta")
@@ -157,17 +223,18 @@ class FrameworkManager:
         table.add_row("Base Repository", str(self.base_dir))
         
         # Check if Hugo config exists - NEW: Hugo config is now in root-level hugo_generated/
+        # One scandir per directory, then set lookups instead of a stat per path
         repo_root = self.current_dir.parent if self.current_dir.name in ['professor', 'students'] else self.current_dir
-        while repo_root.name != repo_root.parent.name and not (repo_root / "dna.yml").exists():
+        names = _entry_names(repo_root)
+        while repo_root.name != repo_root.parent.name and "dna.yml" not in names:
             repo_root = repo_root.parent
-        hugo_config = repo_root / "hugo_generated" / "hugo.toml"
-        table.add_row("Hugo Config", "✅ Exists" if hugo_config.exists() else "❌ Missing")
+            names = _entry_names(repo_root)
+        hugo_config_exists = "hugo_generated" in names and "hugo.toml" in _entry_names(repo_root / "hugo_generated")
+        table.add_row("Hugo Config", "✅ Exists" if hugo_config_exists else "❌ Missing")
         
         # Check if development server is running
         try:
-            result = subprocess.run(["pgrep", "-f", "hugo.*server"], 
-                                  capture_output=True, text=True)
-            server_running = "✅ Running" if result.returncode == 0 else "❌ Not running"
+            server_running = "✅ Running" if self._hugo_server_running() else "❌ Not running"
         except:
             server_running = "❓ Unknown"
         table.add_row("Hugo Server", server_running)
@@ -177,29 +244,63 @@ class FrameworkManager:
         # Show recent content changes
         self.show_recent_changes()
     
+    def _hugo_server_running(self) -> bool:
+        """Check for a running `hugo server` process
+        
+        On Linux the process table is read straight from /proc, avoiding a pgrep
+        fork+exec; elsewhere pgrep is used.
+        
+        Returns:
+            bool: True if a Hugo server process was found
+        """
+        if not os.path.isdir("/proc"):
+            result = subprocess.run(["pgrep", "-f", "hugo.*server"], 
+                                  capture_output=True, text=True)
+            return result.returncode == 0
+        
+        own_pid = str(os.getpid())
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit() or entry.name == own_pid:
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                        cmdline = f.read()
+                except OSError:
+                    continue  # Process exited or is not readable
+                # Same pattern pgrep used: "hugo" followed later by "server"
+                hugo_at = cmdline.find(b"hugo")
+                if hugo_at != -1 and cmdline.find(b"server", hugo_at) != -1:
+                    return True
+        return False
+    
     def show_recent_changes(self):
         """Show recently modified content files"""
+        from rich.table import Table
         
         content_dirs = ["class_notes", "framework_tutorials", "framework_documentation"]
-        recent_files = []
+        cutoff_ns = time.time_ns() - 86_400_000_000_000  # Last 24 hours
+        
+        # Content directories are literal prefixes: check each once, then scan with
+        # plain string paths (Path objects are only built for the rows displayed)
+        root = os.fspath(self.current_dir)
+        prefixes = [os.path.join(root, d) for d in content_dirs]
+        scans = (_scan_recent(prefix, cutoff_ns) for prefix in prefixes if os.path.isdir(prefix))
         
-        for content_dir in content_dirs:
-            dir_path = self.current_dir / content_dir
-            if dir_path.exists():
-                for file_path in dir_path.rglob("*.md"):
-                    if file_path.stat().st_mtime > time.time() - 86400:  # Last 24 hours
-                        recent_files.append((file_path, file_path.stat().st_mtime))
+        # Last 10 straight from the scan: no full list is built or sorted
+        recent_files = heapq.nlargest(10, itertools.chain.from_iterable(scans), key=lambda x: x[1])
         
         if recent_files:
-            recent_files.sort(key=lambda x: x[1], reverse=True)
-            
             table = Table(title="Recent Changes (Last 24h)", show_header=True)
             table.add_column("File", style="cyan")
             table.add_column("Modified", style="yellow")
             
-            for file_path, mtime in recent_files[:10]:  # Show last 10
-                rel_path = file_path.relative_to(self.current_dir)
-                mod_time = time.strftime("%H:%M:%S", time.localtime(mtime))
+            # Local time of day by integer arithmetic, with the UTC offset looked up once
+            tz_offset = time.localtime().tm_gmtoff
+            for file_path, mtime_ns in recent_files:
+                rel_path = os.path.relpath(file_path, root)
+                t = (mtime_ns // 1_000_000_000 + tz_offset) % 86400
+                mod_time = f"{t // 3600:02d}:{t // 60 % 60:02d}:{t % 60:02d}"
                 table.add_row(str(rel_path), mod_time)
                 
             self.console.print(table)
@@ -222,9 +323,9 @@ class FrameworkManager:
             error_callback=error_callback
         )
     
-    def validate_and_generate(self, force: bool = False) -> bool:
+    def validate_and_generate(self, force: bool = False, use_cache: bool = True) -> bool:
         """Run validation and generation pipeline"""
-        return self.operation_sequencer.validate_and_generate(force)
+        return self.operation_sequencer.validate_and_generate(force, use_cache=use_cache)
     
     def start_development_server(self, port: int = None):
         """Start Hugo development server"""
@@ -238,6 +339,10 @@ class FrameworkManager:
         """Build production-ready static site"""
         return self.operation_sequencer.build_production()
     
+    def development_build_pipeline(self, force: bool = False) -> bool:
+        """Run the build pipeline without the static Hugo build"""
+        return self.operation_sequencer.development_build_pipeline(force)
+    
     def full_build_pipeline(self, force: bool = False) -> bool:
         """Run the complete build pipeline"""
         return self.operation_sequencer.full_build_pipeline(force)
@@ -273,6 +378,9 @@ def main():
     
     manager = FrameworkManager()
     manager.verbose = args.verbose
+    manager.operation_sequencer.use_validation_cache = not args.force
+    manager.subprocess_runner.force_subprocess = args.force_subprocess
+    manager.operation_sequencer.fast_clean = args.fast_clean
     manager.message_orchestrator.set_verbose(args.verbose)
     
     # Environment detection and validation
@@ -281,7 +389,7 @@ def main():
         sys.exit(1)
     
     if not manager.validate_environment():
-        console.print("❌ Framework environment validation failed")
+        _console().print("❌ Framework environment validation failed")
         sys.exit(1)
     
     # Show welcome message
@@ -292,26 +400,28 @@ def main():
     }
     manager.ux.show_welcome_panel(framework_info)
     
+    # Route once; flows without a summary skip operation timing entirely
+    flow_key = manager.command_router.route_commands(args)
+    show_summary = manager.command_router.should_show_summary(flow_key)
+    manager.message_orchestrator.collect_stats = show_summary
+    
     # Execute commands
     try:
-        # Route and execute commands
-        flow_key = manager.command_router.route_commands(args)
         success = manager.command_router.execute_command_flow(flow_key, args, manager)
         
         if not success and flow_key != 'help':
-            console.print(f"❌ Command execution failed")
+            _console().print(f"❌ Command execution failed")
             
     except KeyboardInterrupt:
-        console.print("\n🛑 Operation cancelled by user")
+        _console().print("\n🛑 Operation cancelled by user")
         manager.add_message('warnings', 'Operation Cancelled', 'User interrupted the operation', 'User Action')
     except Exception as e:
-        console.print(f"❌ Unexpected error: {e}")
+        _console().print(f"❌ Unexpected error: {e}")
         manager.add_message('errors', 'Unexpected Error', str(e), 'System')
         
     finally:
         # Always show summary at the end (except for dev server and status)
-        flow_key = manager.command_router.route_commands(args)
-        if manager.command_router.should_show_summary(flow_key):
+        if show_summary:
             manager.show_final_summary()
 
 if __name__ == "__main__":
@@ -31,7 +31,7 @@ Examples:
   ./manage.py --publish         Complete build + deploy pipeline
   
 Command Combinations:
-  ./manage.py --build --dev     Build and start development server
+  ./manage.py --build --dev     Generate and start development server (no static build)
   ./manage.py --build --deploy  Build and deploy (same as --publish)
   ./manage.py --sync --build    Sync updates and build (students)
   ./manage.py --sync --dev      Sync updates and start dev server (students)
@@ -39,7 +39,7 @@ Command Combinations:
 Advanced:
   ./manage.py --validate        Run validation only
   ./manage.py --dev --port 8080 Custom development server port
-  ./manage.py --build --force   Skip confirmation prompts
+  ./manage.py --build --force   Skip prompts, always regenerate
   ./manage.py --clean           Remove generated files
         """
     )
@@ -68,9 +68,13 @@ Advanced:
     parser.add_argument("--port", type=int, metavar="PORT",
                        help="Development server port (default: 1313 for professor, 1314 for student)")
     parser.add_argument("--force", "-f", action="store_true",
-                       help="Skip confirmation prompts")
+                       help="Skip confirmation prompts and regenerate even if inputs are unchanged")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Show detailed output and full error messages")
+    parser.add_argument("--fast-clean", action="store_true",
+                       help="With --clean, delete generated files using parallel unlinks")
+    parser.add_argument("--force-subprocess", action="store_true",
+                       help="Run framework scripts in separate Python processes instead of in-process")
     
     return parser
 
@@ -106,7 +110,7 @@ Common Usage:
   ./manage.py --sync            # Sync updates (students)
   
 Pipeline Combinations:
-  ./manage.py --build --dev     # Build then serve
+  ./manage.py --build --dev     # Generate then serve
   ./manage.py --sync --build    # Sync then build (students)
   ./manage.py --publish         # Complete deployment pipeline
 """
@@ -31,6 +31,26 @@ class CommandFlow:
 class CommandRouter:
     """Handles command combination logic and routing"""
     
+    # Flags that select a command flow
+    COMMAND_FLAGS = ('publish', 'build', 'deploy', 'dev', 'sync', 'status', 'validate', 'clean')
+    
+    # (required flags, flow key) in precedence order: the first entry whose flags are
+    # all set wins, so combinations must come before the single commands they contain
+    ROUTING_TABLE = (
+        (frozenset({'publish'}), 'publish'),
+        (frozenset({'build', 'deploy'}), 'publish'),
+        (frozenset({'build', 'dev'}), 'build_and_dev'),
+        (frozenset({'sync', 'build'}), 'sync_and_build'),
+        (frozenset({'sync', 'dev'}), 'sync_and_dev'),
+        (frozenset({'status'}), 'status'),
+        (frozenset({'validate'}), 'validate'),
+        (frozenset({'sync'}), 'sync'),
+        (frozenset({'clean'}), 'clean'),
+        (frozenset({'build'}), 'build'),
+        (frozenset({'deploy'}), 'deploy'),
+        (frozenset({'dev'}), 'dev'),
+    )
+    
     def __init__(self):
         self.command_flows = {}
         self._setup_command_flows()
@@ -45,7 +65,8 @@ class CommandRouter:
                 show_summary=False
             ),
             'validate': CommandFlow(
-                actions=[CommandAction('validate_and_generate', {'force_key': 'force'})]
+                # An explicit --validate always validates, whatever the build cache says
+                actions=[CommandAction('validate_and_generate', {'force_key': 'force', 'use_cache': False})]
             ),
             'sync': CommandFlow(
                 actions=[CommandAction('sync_student_updates', {})]
@@ -83,9 +104,10 @@ class CommandRouter:
                     'confirmation': 'Continue with complete publish?'
                 }
             ),
+            # hugo server renders the site itself, so the static build is skipped
             'build_and_dev': CommandFlow(
                 actions=[
-                    CommandAction('full_build_pipeline', {'force_key': 'force'}),
+                    CommandAction('development_build_pipeline', {'force_key': 'force'}),
                     CommandAction('start_development_server', {'port_key': 'port'})
                 ],
                 show_summary=False
@@ -115,31 +137,11 @@ class CommandRouter:
             str: Command flow key to execute
         """
         
-        # Handle complex combinations first (order matters!)
-        if args.publish or (args.build and args.deploy):
-            return 'publish'
-        elif args.build and args.dev:
-            return 'build_and_dev'
-        elif args.sync and args.build:
-            return 'sync_and_build'
-        elif args.sync and args.dev:
-            return 'sync_and_dev'
+        active = frozenset(flag for flag in self.COMMAND_FLAGS if getattr(args, flag, False))
         
-        # Handle single commands
-        elif args.status:
-            return 'status'
-        elif args.validate:
-            return 'validate'
-        elif args.sync:
-            return 'sync'
-        elif args.clean:
-            return 'clean'
-        elif args.build:
-            return 'build'
-        elif args.deploy:
-            return 'deploy'
-        elif args.dev:
-            return 'dev'
+        for required, flow_key in self.ROUTING_TABLE:
+            if required <= active:
+                return flow_key
         
         # No valid command found
         return 'help'
@@ -7,9 +7,66 @@ from the original manage.py for better modularity.
 Maintains exact compatibility with the original environment detection behavior.
 """
 
+import functools
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from rich.console import Console
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: detection alone never prints
+    from rich.console import Console
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_layout(cwd: str) -> Tuple[Optional[str], Optional[str]]:
+    """Classify a working directory, memoized per directory for the process lifetime
+    
+    Ancestors are resolved as strings with a single dna.yml check per candidate.
+    
+    Args:
+        cwd: Working directory path
+        
+    Returns:
+        tuple: (layout, base_dir) where layout is 'professor', 'student' or 'root';
+            (None, None) if cwd is not inside a framework repository
+    """
+    parent = os.path.dirname(cwd)
+    grandparent = os.path.dirname(parent)
+    
+    if os.path.basename(cwd) == "professor" and os.path.isfile(os.path.join(parent, "dna.yml")):
+        return "professor", parent
+    if os.path.basename(parent) == "students" and os.path.isfile(os.path.join(grandparent, "dna.yml")):
+        return "student", grandparent
+    if os.path.isfile(os.path.join(cwd, "dna.yml")):
+        return "root", cwd
+    return None, None
+
+
+@functools.lru_cache(maxsize=8)
+def _missing_required_files(framework_dir: str, role: str) -> Tuple[str, ...]:
+    """Required framework scripts that do not exist, memoized per (framework_dir, role)
+    
+    Args:
+        framework_dir: Framework directory path
+        role: User role (professor/student)
+        
+    Returns:
+        tuple: Paths of the missing files
+    """
+    scripts_dir = os.path.join(framework_dir, "scripts")
+    required_files = ["generate_hugo_config.py", "validate_content.py"]
+    
+    if role == "student":
+        required_files.append("sync_student.py")
+    
+    # One directory listing instead of a stat per required file
+    try:
+        with os.scandir(scripts_dir) as entries:
+            names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        names = set()
+        
+    return tuple(os.path.join(scripts_dir, name) for name in required_files if name not in names)
 
 
 class EnvironmentContext:
@@ -26,10 +83,18 @@ class EnvironmentContext:
 class EnvironmentManager:
     """Manages environment detection and validation for the framework"""
     
-    def __init__(self, console: Console = None):
-        self.console = console or Console()
+    def __init__(self, console: "Console" = None):
+        self._console = console
         self.context = EnvironmentContext()
     
+    @property
+    def console(self) -> "Console":
+        """Console for user messages, created on first use if none was given"""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
+    
     def detect_environment(self) -> Tuple[bool, EnvironmentContext]:
         """Detect if we're in a valid framework directory and determine role
         
@@ -39,7 +104,6 @@ class EnvironmentManager:
         
         # Check if manage.sh provided target directory info via environment variables
         # This happens when running build/deploy operations from repo root
-        import os
         build_target_dir = os.environ.get('BUILD_TARGET_DIR')
         build_target = os.environ.get('BUILD_TARGET')
         
@@ -64,31 +128,21 @@ class EnvironmentManager:
                 return True, self.context
         
         # Fall back to current working directory detection
-        current_dir = Path.cwd()
+        cwd = os.getcwd()
+        layout, base_dir = _detect_layout(cwd)
         
-        # Check if we're in professor directory
-        if current_dir.name == "professor" and (current_dir.parent / "dna.yml").exists():
-            self.context.role = "professor"
-            self.context.base_dir = current_dir.parent
-            # NEW: Framework is now at root level
-            self.context.framework_dir = current_dir.parent / "framework"
-            self.context.is_valid_setup = True
-            self.context.current_dir = current_dir
-            return True, self.context
-            
-        # Check if we're in a student directory
-        elif (current_dir.parent.name == "students" and 
-              (current_dir.parent.parent / "dna.yml").exists()):
-            self.context.role = "student"
-            self.context.base_dir = current_dir.parent.parent
+        # Professor or student directory
+        if layout in ("professor", "student"):
+            self.context.role = layout
+            self.context.base_dir = Path(base_dir)
             # NEW: Framework is now at root level
-            self.context.framework_dir = current_dir.parent.parent / "framework"
+            self.context.framework_dir = self.context.base_dir / "framework"
             self.context.is_valid_setup = True
-            self.context.current_dir = current_dir
+            self.context.current_dir = Path(cwd)
             return True, self.context
             
         # Check if we're in repository root
-        elif (current_dir / "dna.yml").exists():
+        elif layout == "root":
             self.console.print("📁 You're in the repository root. Please navigate to:")
             self.console.print("   Professor: [cyan]cd professor[/cyan]")
             self.console.print("   Student: [cyan]cd students/[your-username][/cyan]")
@@ -112,18 +166,7 @@ class EnvironmentManager:
         if not context.is_valid_setup:
             return False, ["Environment not properly detected"]
             
-        required_files = [
-            context.framework_dir / "scripts" / "generate_hugo_config.py",
-            context.framework_dir / "scripts" / "validate_content.py"
-        ]
-        
-        if context.role == "student":
-            required_files.append(context.framework_dir / "scripts" / "sync_student.py")
-            
-        missing_files = []
-        for file_path in required_files:
-            if not file_path.exists():
-                missing_files.append(str(file_path))
+        missing_files = list(_missing_required_files(os.fspath(context.framework_dir), context.role))
         
         return len(missing_files) == 0, missing_files
     
@@ -8,37 +8,84 @@ Maintains exact compatibility with the original message system behavior.
 """
 
 import time
-from typing import Dict, List, Optional
-from rich.console import Console
+import types
+from collections import deque
+from typing import Deque, Dict, List, Mapping, NamedTuple, Optional, Tuple
+from rich.console import Console, Group
 from rich.table import Table
+from rich.text import Text
+
+
+class Message(NamedTuple):
+    """A message collected for the final summary
+    
+    The details_* fields and duration_text are derived once, when the message is added.
+    """
+    title: str
+    details: Optional[str]
+    context: Optional[str]
+    duration: Optional[float]
+    details_preview: str = ""
+    details_head: Tuple[str, ...] = ()
+    details_truncated: bool = False
+    duration_text: str = "-"
 
 
 class MessageOrchestrator:
     """Handles message collection, operation tracking, and summary reporting"""
     
+    # Column definitions for the summary table, shared by every render
+    _SUMMARY_COLUMNS = (
+        {'header': "Operation", 'style': "white", 'width': 25},
+        {'header': "Status", 'style': "white", 'width': 12},
+        {'header': "Duration", 'style': "dim", 'width': 10},
+        {'header': "Details", 'style': "dim"},
+    )
+    
+    # Summary status cell and whether a duration is shown, per message type
+    _SUMMARY_STATUS = {
+        'success': ("[green]✅ Success[/green]", True),
+        'errors': ("[red]❌ Failed[/red]", True),
+        'warnings': ("[yellow]⚠️ Warning[/yellow]", False),
+    }
+    
+    # Longest details text shown in a summary row before truncation
+    _SUMMARY_DETAILS_WIDTH = 50
+    
+    # Separator bars framing the summary heading and the final status line
+    _SUMMARY_HEADING_BAR = "=" * 60
+    _SUMMARY_STATUS_BAR = "─" * 60
+    
     def __init__(self, console: Console = None):
         self.console = console or Console()
         
         # Message collection system
-        self.messages = {
-            'errors': [],
-            'warnings': [],
-            'info': [],
-            'success': []
+        self.messages: Dict[str, Deque[Message]] = {
+            'errors': deque(),
+            'warnings': deque(),
+            'info': deque(),
+            'success': deque()
         }
         
+        # Total across all buckets, so has_messages() needs no scan
+        self._message_count = 0
+        
         # Operation tracking
         self.operation_start_time = None
         self.current_operation = None
         self.verbose = False
         
+        # Timing and statistics only feed the final summary; disabled for flows without one
+        self.collect_stats = True
+        
         # Operation statistics
         self.operation_stats = {
             'total_operations': 0,
             'successful_operations': 0,
             'failed_operations': 0,
-            'total_duration': 0
+            'total_duration_ns': 0
         }
+        self._operation_stats_view = types.MappingProxyType(self.operation_stats)
     
     def set_verbose(self, verbose: bool):
         """Set verbose mode for operation display"""
@@ -58,15 +105,22 @@ class MessageOrchestrator:
         
         if message_type not in self.messages:
             return
-            
-        message = {
-            'title': title,
-            'details': details,
-            'context': context or self.current_operation,
-            'timestamp': time.time(),
-            'duration': duration
-        }
+        
+        message = Message(
+            title, details, context or self.current_operation, duration,
+            duration_text=f"{duration:.1f}s" if duration else "-"
+        )
+        if details:
+            # Summary table cell and the first lines shown under "Error Details"
+            width = self._SUMMARY_DETAILS_WIDTH
+            lines = details.split('\n', 2)
+            message = message._replace(
+                details_preview=details if len(details) <= width else details[:width] + "...",
+                details_head=tuple(lines[:2]),
+                details_truncated=len(lines) > 2
+            )
         self.messages[message_type].append(message)
+        self._message_count += 1
     
     def start_operation(self, operation_name: str):
         """Start tracking an operation
@@ -76,8 +130,9 @@ class MessageOrchestrator:
         """
         
         self.current_operation = operation_name
-        self.operation_start_time = time.time()
-        self.operation_stats['total_operations'] += 1
+        if self.collect_stats:
+            self.operation_start_time = time.perf_counter_ns()
+            self.operation_stats['total_operations'] += 1
         
         if self.verbose:
             self.console.print(f"\n🔄 [bold]{operation_name}[/bold]")
@@ -92,22 +147,26 @@ class MessageOrchestrator:
             message: Optional completion message
         """
         
-        if self.operation_start_time:
-            duration = time.time() - self.operation_start_time
+        if self.operation_start_time is not None:
+            # Monotonic integer nanoseconds: no negative durations on clock changes
+            duration_ns = time.perf_counter_ns() - self.operation_start_time
+            duration = duration_ns / 1e9
             duration_str = f"({duration:.1f}s)"
-            self.operation_stats['total_duration'] += duration
+            self.operation_stats['total_duration_ns'] += duration_ns
         else:
             duration = None
             duration_str = ""
             
         if success:
             icon = "✅"
-            self.operation_stats['successful_operations'] += 1
+            if self.collect_stats:
+                self.operation_stats['successful_operations'] += 1
             if message:
                 self.add_message('success', self.current_operation, message, None, duration)
         else:
             icon = "❌"
-            self.operation_stats['failed_operations'] += 1
+            if self.collect_stats:
+                self.operation_stats['failed_operations'] += 1
             if message:
                 self.add_message('errors', self.current_operation, message, None, duration)
                 
@@ -126,109 +185,96 @@ class MessageOrchestrator:
     
     def has_messages(self) -> bool:
         """Check if there are any messages to show"""
-        return any(self.messages.values())
+        return self._message_count > 0
     
     def show_final_summary(self):
-        """Show final summary of all operations with warnings and errors"""
+        """Show final summary of all operations with warnings and errors
+        
+        The summary is assembled into a single Group and printed once. Message
+        text goes into Text objects, so titles and details are neither parsed
+        as markup nor able to break it.
+        """
         
         if not self.has_messages():
             return
-            
-        self.console.print("\n" + "="*60)
-        self.console.print("📊 [bold]Operation Summary[/bold]")
-        self.console.print("="*60)
         
-        # Create summary table
-        table = Table(title="Operation Summary", show_header=True, header_style="bold cyan")
-        table.add_column("Operation", style="white", width=25)
-        table.add_column("Status", style="white", width=12)
-        table.add_column("Duration", style="dim", width=10)
-        table.add_column("Details", style="dim")
+        parts = []
+        out = parts.append
+            
+        out("\n" + self._SUMMARY_HEADING_BAR)
+        out("📊 [bold]Operation Summary[/bold]")
+        out(self._SUMMARY_HEADING_BAR)
         
-        # Add successful operations
-        for success in self.messages['success']:
-            duration_str = f"{success['duration']:.1f}s" if success.get('duration') else "-"
-            details = success['details'][:50] + "..." if success['details'] and len(success['details']) > 50 else success['details'] or ""
-            table.add_row(
-                success['title'],
-                "[green]✅ Success[/green]",
-                duration_str,
-                details
-            )
+        # Single pass over the collected messages: every message contributes its
+        # table row and, where shown, its detail lines, which render after the table
+        rows = []
+        error_details = []
+        warning_details = []
+        important_info = []
         
-        # Add errors
-        for error in self.messages['errors']:
-            duration_str = f"{error['duration']:.1f}s" if error.get('duration') else "-"
-            details = error['details'][:50] + "..." if error['details'] and len(error['details']) > 50 else error['details'] or ""
-            table.add_row(
-                error['title'],
-                "[red]❌ Failed[/red]",
-                duration_str,
-                details
-            )
+        # Rows in display order: successes, then errors, then warnings
+        for message_type in ('success', 'errors', 'warnings'):
+            status, show_duration = self._SUMMARY_STATUS[message_type]
+            for i, message in enumerate(self.messages[message_type], 1):
+                rows.append((
+                    Text(message.title or ""),
+                    status,
+                    message.duration_text if show_duration else "-",
+                    Text(message.details_preview)
+                ))
+                if message_type == 'errors':
+                    error_details.append(Text.assemble(f"  {i}. ", (message.title or "", "red")))
+                    if self.verbose:
+                        if message.context:
+                            error_details.append(Text.assemble("     Context: ", (message.context, "dim")))
+                        if message.details:
+                            for line in message.details.split('\n'):
+                                if line.strip():
+                                    error_details.append(Text(f"     {line.strip()}"))
+                        error_details.append("")
+                    else:
+                        # Show first few lines of error details
+                        for line in message.details_head:
+                            if line.strip():
+                                error_details.append(Text.assemble("     ", (line.strip(), "dim")))
+                        if message.details_truncated:
+                            error_details.append("     [dim]... (use --verbose for full details)[/dim]")
+                elif message_type == 'warnings' and self.verbose:
+                    warning_details.append(Text.assemble(f"  {i}. ", (message.title or "", "yellow")))
+                    if message.context:
+                        warning_details.append(Text.assemble("     Context: ", (message.context, "dim")))
+                    if message.details:
+                        warning_details.append(Text(f"     {message.details}"))
+                    warning_details.append("")
         
-        # Add warnings
-        for warning in self.messages['warnings']:
-            details = warning['details'][:50] + "..." if warning['details'] and len(warning['details']) > 50 else warning['details'] or ""
-            table.add_row(
-                warning['title'],
-                "[yellow]⚠️ Warning[/yellow]",
-                "-",
-                details
-            )
+        for info in self.messages['info']:
+            title = info.title.lower()
+            if 'server' not in title and 'build' not in title:
+                continue
+            important_info.append(Text.assemble("  • ", (info.title or "", "blue")))
+            if info.details:
+                # Handle multi-line details
+                for line in info.details.split('\n'):
+                    if line.strip():
+                        important_info.append(Text(f"    {line.strip()}"))
         
-        self.console.print(table)
+        out(self._make_summary_table(rows))
         
-        # Show detailed errors if any exist
-        if self.messages['errors'] and not self.verbose:
-            self.console.print("\n❌ [bold red]Error Details:[/bold red]")
-            for i, error in enumerate(self.messages['errors'], 1):
-                self.console.print(f"  {i}. [red]{error['title']}[/red]")
-                if error['details']:
-                    # Show first few lines of error details
-                    details_lines = error['details'].split('\n')[:2]
-                    for line in details_lines:
-                        if line.strip():
-                            self.console.print(f"     [dim]{line.strip()}[/dim]")
-                    if len(error['details'].split('\n')) > 2:
-                        self.console.print("     [dim]... (use --verbose for full details)[/dim]")
+        if error_details:
+            if self.verbose:
+                out("\n❌ [bold red]Full Error Details:[/bold red]")
+            else:
+                out("\n❌ [bold red]Error Details:[/bold red]")
+            parts.extend(error_details)
         
-        # Show verbose details if enabled
-        if self.verbose and (self.messages['errors'] or self.messages['warnings']):
-            if self.messages['errors']:
-                self.console.print("\n❌ [bold red]Full Error Details:[/bold red]")
-                for i, error in enumerate(self.messages['errors'], 1):
-                    self.console.print(f"  {i}. [red]{error['title']}[/red]")
-                    if error['context']:
-                        self.console.print(f"     Context: [dim]{error['context']}[/dim]")
-                    if error['details']:
-                        for line in error['details'].split('\n'):
-                            if line.strip():
-                                self.console.print(f"     {line.strip()}")
-                    self.console.print()
-            
-            if self.messages['warnings']:
-                self.console.print("⚠️ [bold yellow]Full Warning Details:[/bold yellow]")
-                for i, warning in enumerate(self.messages['warnings'], 1):
-                    self.console.print(f"  {i}. [yellow]{warning['title']}[/yellow]")
-                    if warning['context']:
-                        self.console.print(f"     Context: [dim]{warning['context']}[/dim]")
-                    if warning['details']:
-                        self.console.print(f"     {warning['details']}")
-                    self.console.print()
+        if warning_details:
+            out("⚠️ [bold yellow]Full Warning Details:[/bold yellow]")
+            parts.extend(warning_details)
         
         # Show important info
-        if self.messages['info']:
-            important_info = [info for info in self.messages['info'] if 'server' in info['title'].lower() or 'build' in info['title'].lower()]
-            if important_info:
-                self.console.print("\n📝 [bold blue]Important Information:[/bold blue]")
-                for info in important_info:
-                    self.console.print(f"  • [blue]{info['title']}[/blue]")
-                    if info['details']:
-                        # Handle multi-line details
-                        for line in info['details'].split('\n'):
-                            if line.strip():
-                                self.console.print(f"    {line.strip()}")
+        if important_info:
+            out("\n📝 [bold blue]Important Information:[/bold blue]")
+            parts.extend(important_info)
         
         # Show statistics and final status
         stats_table = Table(show_header=False, box=None)
@@ -239,48 +285,73 @@ class MessageOrchestrator:
         stats_table.add_row("Successful:", f"[green]{self.operation_stats['successful_operations']}[/green]")
         if self.operation_stats['failed_operations'] > 0:
             stats_table.add_row("Failed:", f"[red]{self.operation_stats['failed_operations']}[/red]")
-        if self.operation_stats['total_duration'] > 0:
-            stats_table.add_row("Total Duration:", f"{self.operation_stats['total_duration']:.1f}s")
+        if self.operation_stats['total_duration_ns'] > 0:
+            stats_table.add_row("Total Duration:", f"{self.operation_stats['total_duration_ns'] / 1e9:.1f}s")
         
-        self.console.print("\n")
-        self.console.print(stats_table)
+        out("\n")
+        out(stats_table)
         
         # Final status message
-        self.console.print("\n" + "─"*60)
+        out("\n" + self._SUMMARY_STATUS_BAR)
         if self.messages['errors']:
-            self.console.print("🛑 [bold red]Operations completed with errors[/bold red]")
+            out("🛑 [bold red]Operations completed with errors[/bold red]")
             if not self.verbose:
-                self.console.print("   💡 Use [cyan]--verbose[/cyan] flag for detailed error information")
+                out("   💡 Use [cyan]--verbose[/cyan] flag for detailed error information")
         elif self.messages['warnings']:
-            self.console.print("⚠️ [bold yellow]Operations completed with warnings[/bold yellow]")
+            out("⚠️ [bold yellow]Operations completed with warnings[/bold yellow]")
             if not self.verbose:
-                self.console.print("   💡 Use [cyan]--verbose[/cyan] flag for detailed warning information")
+                out("   💡 Use [cyan]--verbose[/cyan] flag for detailed warning information")
         else:
-            self.console.print("✅ [bold green]All operations completed successfully![/bold green]")
-        self.console.print("─"*60)
+            out("✅ [bold green]All operations completed successfully![/bold green]")
+        out(self._SUMMARY_STATUS_BAR)
+        
+        # One layout pass and one write for the whole summary
+        self.console.print(Group(*parts))
+    
+    def _make_summary_table(self, rows: List[tuple]) -> Table:
+        """Build the operation summary table
+        
+        Args:
+            rows: Pre-formatted (operation, status, duration, details) rows
+            
+        Returns:
+            Table: Summary table ready to print
+        """
+        table = Table(title="Operation Summary", show_header=True, header_style="bold cyan")
+        for column in self._SUMMARY_COLUMNS:
+            table.add_column(**column)
+        for row in rows:
+            table.add_row(*row)
+        return table
     
-    def get_operation_statistics(self) -> Dict[str, int]:
+    def get_operation_statistics(self) -> Mapping[str, int]:
         """Get current operation statistics
         
         Returns:
-            dict: Operation statistics
+            Mapping: Live read-only view of the operation statistics
+        """
+        return self._operation_stats_view
+    
+    def snapshot_statistics(self) -> Dict[str, int]:
+        """Get a copy of the current operation statistics
+        
+        Returns:
+            dict: Operation statistics at the time of the call
         """
         return self.operation_stats.copy()
     
     def clear_messages(self):
         """Clear all collected messages and reset statistics"""
         self.messages = {
-            'errors': [],
-            'warnings': [],
-            'info': [],
-            'success': []
-        }
-        self.operation_stats = {
-            'total_operations': 0,
-            'successful_operations': 0,
-            'failed_operations': 0,
-            'total_duration': 0
+            'errors': deque(),
+            'warnings': deque(),
+            'info': deque(),
+            'success': deque()
         }
+        self._message_count = 0
+        # Reset in place so views returned by get_operation_statistics stay live
+        for key in self.operation_stats:
+            self.operation_stats[key] = 0
 
 
 if __name__ == "__main__":
@@ -7,13 +7,88 @@ and sequencing extracted from the original manage.py for better modularity.
 Maintains exact compatibility with the original operation behavior.
 """
 
+import hashlib
+import json
+import os
 import subprocess
 import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional, Callable, Dict, Any
 
 from rich.console import Console
-from rich.prompt import Confirm
+
+try:
+    import orjson  # Optional: faster JSON for the build cache
+except ImportError:
+    orjson = None
+
+# Suffixes of the files validate_and_generate reads (content, configs, data, scripts, templates)
+FINGERPRINT_SUFFIXES = {'.md', '.yml', '.yaml', '.toml', '.json', '.py', '.j2'}
+
+# Environment variables read by inject_class_context.py
+FINGERPRINT_ENV_VARS = ('SUPABASE_URL', 'SUPABASE_ANON_KEY')
+
+# Directories never entered while fingerprinting: caches and build output the run
+# itself rewrites (dot directories are skipped as well)
+FINGERPRINT_SKIP_DIRS = frozenset({'.framework_cache', 'hugo_generated'})
+
+# Threads issuing unlink calls in _fast_rmtree
+FAST_CLEAN_WORKERS = 8
+
+
+def _iter_fingerprint_files(directory: Path):
+    """Yield the input files under a directory that feed the build fingerprint
+    
+    Prunes FINGERPRINT_SKIP_DIRS and dot directories without entering them.
+    
+    Args:
+        directory: Directory to walk
+        
+    Yields:
+        Path objects for files with a FINGERPRINT_SUFFIXES suffix
+    """
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = [name for name in dirnames
+                       if name not in FINGERPRINT_SKIP_DIRS and not name.startswith('.')]
+        for name in filenames:
+            if os.path.splitext(name)[1] in FINGERPRINT_SUFFIXES:
+                yield Path(dirpath, name)
+
+
+def _fast_rmtree(root: str):
+    """Remove a directory tree, unlinking its files from a thread pool
+    
+    Directories are listed once with os.scandir, files are unlinked in parallel
+    (unlink is I/O bound and releases the GIL), then directories are removed
+    deepest first. Symlinks are removed, never followed.
+    
+    Args:
+        root: Directory to remove
+    """
+    files, dirs = [], []
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        dirs.append(path)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+    
+    with ThreadPoolExecutor(max_workers=FAST_CLEAN_WORKERS) as executor:
+        # Consuming the results re-raises the first unlink error
+        for _ in executor.map(os.unlink, files):
+            pass
+    
+    # Every directory was listed after its parent, so reversed order is children first
+    for path in reversed(dirs):
+        os.rmdir(path)
 
 
 class OperationSequencer:
@@ -31,6 +106,18 @@ class OperationSequencer:
         self.current_dir = None
         self.framework_dir = None
         self.role = None
+        
+        # Guards message collection when scripts of one stage run concurrently
+        self._message_lock = threading.Lock()
+        
+        # Parsed YAML configs keyed by path -> (st_mtime_ns, data)
+        self._config_cache: Dict[Path, tuple] = {}
+        
+        # Skip validate_and_generate when its inputs are unchanged (disabled by --force)
+        self.use_validation_cache = True
+        
+        # Remove generated trees with parallel unlinks instead of shutil.rmtree (--fast-clean)
+        self.fast_clean = False
     
     def set_dependencies(self, subprocess_runner, message_orchestrator, ux):
         """Inject dependencies from the main framework manager
@@ -55,6 +142,42 @@ class OperationSequencer:
         self.current_dir = current_dir
         self.framework_dir = framework_dir
         self.role = role
+        
+        # Drop values derived from the previous context
+        for name in ('_scripts_dir', '_generated_dir', '_hugo_toml'):
+            self.__dict__.pop(name, None)
+    
+    @cached_property
+    def _scripts_dir(self) -> Path:
+        """Directory holding the framework scripts"""
+        return self.framework_dir / "scripts"
+    
+    @cached_property
+    def _generated_dir(self) -> Path:
+        """Root-level hugo_generated/ build directory"""
+        return self._get_repo_root() / "hugo_generated"
+    
+    @cached_property
+    def _hugo_toml(self) -> Path:
+        """Generated Hugo config inside hugo_generated/"""
+        return self._generated_dir / "hugo.toml"
+    
+    @cached_property
+    def _hugo_path(self) -> Optional[str]:
+        """Resolved path of the hugo executable, or None if not installed (looked up once per run)"""
+        return shutil.which("hugo")
+    
+    def _require_hugo(self) -> bool:
+        """Record an error if Hugo is not installed
+        
+        Returns:
+            bool: True if Hugo is available
+        """
+        if not self._hugo_path:
+            self.message_orchestrator.add_message('errors', 'Hugo Not Found',
+                'The hugo executable is not on PATH. Install Hugo extended: https://gohugo.io/installation/')
+            return False
+        return True
     
     def _get_repo_root(self) -> Path:
         """Get repository root directory consistently across all operations"""
@@ -71,11 +194,16 @@ class OperationSequencer:
                 repo_root = repo_root.parent
         return repo_root
     
-    def validate_and_generate(self, force: bool = False) -> bool:
+    def validate_and_generate(self, force: bool = False, with_grading_json: bool = False,
+                              use_cache: bool = True) -> bool:
         """Run validation and generation pipeline
         
         Args:
             force: Skip user confirmation if True
+            with_grading_json: Also generate the grading JSON files, overlapped with
+                class context injection
+            use_cache: Skip the run when inputs are unchanged since the last one
+                (False for an explicit --validate)
             
         Returns:
             bool: True if successful, False otherwise
@@ -88,45 +216,213 @@ class OperationSequencer:
                 self.message_orchestrator.end_operation(False, "Operation cancelled by user")
                 return False
         
-        # Run the main generation script
-        script_path = self.framework_dir / "scripts" / "generate_hugo_config.py"
+        repo_root = self._get_repo_root()
+        cache_file = repo_root / ".framework_cache" / "validate.json"
+        if use_cache and self.use_validation_cache and self._hugo_toml.exists():
+            try:
+                cached = self._read_cache_file(cache_file)
+            except (OSError, ValueError):
+                cached = None
+            if (isinstance(cached, dict) and cached.get('fingerprint') == self._input_fingerprint()
+                    and (cached.get('grading_json') or not with_grading_json)):
+                self.message_orchestrator.end_operation(True, "Framework files up to date - skipped (cache hit)")
+                return True
+        
+        target_directory = "professor" if self.current_dir.name == "professor" else "student"
+        
+        # Scripts within a stage are independent and run concurrently; stages run in order.
+        # inject_class_context rewrites the hugo.toml produced by generate_hugo_config,
+        # so the two cannot share a stage.
+        stages = [
+            [{
+                'script': 'generate_hugo_config.py',
+                'description': 'Validating and generating framework files',
+                'working_directory': self.current_dir,
+                'failure_message': 'Validation/generation failed'
+            }],
+            [{
+                'script': 'inject_class_context.py',
+                'args': [target_directory],
+                'description': 'Injecting class context for frontend',
+                'working_directory': self.current_dir.parent,  # Run from project root
+                # Don't fail the entire build for this - it's not critical
+                'failure_warning': ('Class context injection failed', 'Frontend features may be limited')
+            }]
+        ]
+        
+        if with_grading_json:
+            # Needs items.json from stage 1 but nothing from context injection. It runs as a
+            # separate process so it overlaps the in-process injection instead of queuing
+            # behind it.
+            stages[1].append({
+                'script': 'generate_all_grading_json.py',
+                'subprocess': True,
+                'description': 'Generating grading JSON files',
+                'working_directory': self.current_dir,
+                'failure_warning': ('Grading JSON Generation Failed', 'Failed to generate grading JSON files but continuing build')
+            })
         
         # Create error callback for subprocess runner
         def error_callback(desc: str, error_text: str):
-            self.message_orchestrator.add_message('errors', desc, error_text)
+            with self._message_lock:
+                self.message_orchestrator.add_message('errors', desc, error_text)
         
-        result = self.subprocess_runner.run_command(
-            command=["python3", str(script_path)],
-            description="Validating and generating framework files",
-            working_directory=self.current_dir,
-            capture_output=True,
-            verbose=self.message_orchestrator.verbose,
-            error_callback=error_callback
-        )
+        for stage in stages:
+            results = self._run_script_stage(stage, error_callback)
+            
+            for spec in stage:
+                if results[spec['script']].returncode == 0:
+                    continue
+                if 'failure_warning' in spec:
+                    self.message_orchestrator.add_message('warnings', *spec['failure_warning'])
+                else:
+                    self.message_orchestrator.end_operation(False, spec['failure_message'])
+                    return False
+            
+        # Fingerprint after the run: generation rewrites index files among the inputs
+        try:
+            self._write_cache_file(cache_file, {
+                'fingerprint': self._input_fingerprint(),
+                'grading_json': with_grading_json
+            })
+        except OSError:
+            pass  # Caching is best effort; the next run simply regenerates
+            
+        self.message_orchestrator.end_operation(True, "Framework files validated and generated")
+        return True
+    
+    def _input_fingerprint(self) -> str:
+        """Fingerprint the inputs of validate_and_generate
         
-        if result.returncode != 0:
-            self.message_orchestrator.end_operation(False, "Validation/generation failed")
-            return False
+        Hashes (path, st_mtime_ns, st_size) of every input file rather than file
+        contents, so checking an unchanged tree only costs a directory walk. Caches
+        and build output the run rewrites are left out, or the cache would never hit.
+        The environment variables and git origin URL that inject_class_context.py
+        reads are part of the digest too, since a cache hit also skips that script.
         
-        # Inject class context for frontend JavaScript configuration
-        inject_script_path = self.framework_dir / "scripts" / "inject_class_context.py"
-        target_directory = "professor" if self.current_dir.name == "professor" else "student"
+        Returns:
+            str: Hex digest identifying the current state of the inputs
+        """
+        repo_root = self._get_repo_root()
+        # Single files read by inject_class_context.py outside the walked directories
+        files = [
+            repo_root / "dna.yml",
+            repo_root / "course.yml",
+            repo_root / "config.yml",
+            repo_root / "professor" / "config.yml",
+            repo_root / ".env",
+            repo_root / ".env.local",
+            repo_root / "supabase" / ".env"
+        ]
+        for directory in (self.current_dir,
+                          repo_root / "class_template",
+                          self._scripts_dir,
+                          self.framework_dir / "hugo_config"):
+            files.extend(_iter_fingerprint_files(directory))
+        
+        entries = []
+        for path in files:
+            try:
+                st = path.stat()
+                entries.append((str(path), st.st_mtime_ns, st.st_size))
+            except OSError:
+                entries.append((str(path), None, None))
+        entries.sort()
+        entries.extend((name, os.environ.get(name)) for name in FINGERPRINT_ENV_VARS)
+        # class_id falls back to the origin remote's repository name
+        entries.append(('git remote origin', self._origin_url(repo_root)))
+        
+        # blake2b: fast on CPython and no cryptographic strength is needed here
+        return hashlib.blake2b(repr(entries).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _origin_url(self, repo_root: Path) -> Optional[str]:
+        """URL of the git origin remote, as inject_class_context.py reads it
         
-        result = self.subprocess_runner.run_command(
-            command=["python3", str(inject_script_path), target_directory],
-            description="Injecting class context for frontend",
-            working_directory=self.current_dir.parent,  # Run from project root
-            capture_output=True,
-            verbose=self.message_orchestrator.verbose,
-            error_callback=error_callback
-        )
+        Args:
+            repo_root: Repository root
+            
+        Returns:
+            str: Remote URL, or None when there is no git or no origin remote
+        """
+        try:
+            result = subprocess.run(['git', 'remote', 'get-url', 'origin'],
+                                    cwd=repo_root, capture_output=True, text=True)
+        except OSError:
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+    
+    def _read_cache_file(self, path: Path) -> Dict[str, Any]:
+        """Read a JSON cache file
         
-        if result.returncode != 0:
-            self.message_orchestrator.add_message('warnings', 'Class context injection failed', 'Frontend features may be limited')
-            # Don't fail the entire build for this - it's not critical
+        Args:
+            path: Cache file path
             
-        self.message_orchestrator.end_operation(True, "Framework files validated and generated")
-        return True
+        Returns:
+            dict: Cached data
+        """
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson else json.loads(data)
+    
+    def _write_cache_file(self, path: Path, data: Dict[str, Any]):
+        """Write a JSON cache file atomically
+        
+        The data goes to a temporary file that then replaces the target, so an
+        interrupted run (e.g. Ctrl+C) never leaves a half-written cache behind.
+        
+        Args:
+            path: Cache file path
+            data: JSON-serializable data
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.json.tmp')
+        tmp.write_bytes(orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8'))
+        os.replace(tmp, path)
+    
+    def _run_script_stage(self, stage: List[Dict[str, Any]],
+                          error_callback: Callable[[str, str], None]) -> Dict[str, subprocess.CompletedProcess]:
+        """Run one stage of independent framework scripts concurrently
+        
+        Args:
+            stage: Script specs with 'script', 'description', 'working_directory' and optional
+                'args'; specs with 'subprocess' set run in a child process instead of in-process
+            error_callback: Function to call with (description, error_text) on errors
+            
+        Returns:
+            dict: Script name mapped to its subprocess result
+        """
+        
+        def run(spec: Dict[str, Any]) -> subprocess.CompletedProcess:
+            if spec.get('subprocess'):
+                # Output is not echoed: in-process scripts of the same stage redirect sys.stdout
+                return self.subprocess_runner.run_command(
+                    command=[self.subprocess_runner.python_path, str(self._scripts_dir / spec['script'])] + spec.get('args', []),
+                    description=spec['description'],
+                    working_directory=spec['working_directory'],
+                    capture_output=True,
+                    show_progress=self.message_orchestrator.verbose,
+                    error_callback=error_callback
+                )
+            return self.subprocess_runner.run_framework_script(
+                script_name=spec['script'],
+                working_directory=spec['working_directory'],
+                framework_dir=self.framework_dir,
+                args=spec.get('args'),
+                description=spec['description'],
+                verbose=self.message_orchestrator.verbose,
+                error_callback=error_callback
+            )
+        
+        # No pool overhead for the common single-script stage
+        if len(stage) == 1:
+            return {stage[0]['script']: run(stage[0])}
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(stage)) as executor:
+            futures = {executor.submit(run, spec): spec['script'] for spec in stage}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
     
     def start_development_server(self, port: int = None):
         """Start Hugo development server
@@ -138,10 +434,12 @@ class OperationSequencer:
         # Default ports by role
         if port is None:
             port = 1313 if self.role == "professor" else 1314
+        
+        if not self._require_hugo():
+            return False
             
         # NEW: Hugo config is now in root-level hugo_generated/
-        repo_root = self._get_repo_root()
-        hugo_config = repo_root / "hugo_generated" / "hugo.toml"
+        hugo_config = self._hugo_toml
         if not hugo_config.exists():
             self.message_orchestrator.add_message('warnings', 'Missing Hugo Config', 'Hugo config not found. Running generation first...')
             if not self.validate_and_generate(force=True):
@@ -151,40 +449,112 @@ class OperationSequencer:
         
         self.message_orchestrator.add_message('info', 'Development Server Started', f'Server running on http://localhost:{port}', 'Development')
         
+        command = [
+            self._hugo_path, "server",
+            "--config", str(hugo_config),
+            "--port", str(port),
+            "--bind", "0.0.0.0"
+        ]
+        
+        if os.name == "posix":
+            # The server is the last step of every dev flow (none shows a summary), so
+            # Hugo replaces this process: Ctrl+C reaches it directly and no idle Python
+            # parent stays resident
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.chdir(self.current_dir)
+            os.execv(self._hugo_path, command)
+        
         try:
-            subprocess.run([
-                "hugo", "server",
-                "--config", str(hugo_config),
-                "--port", str(port),
-                "--bind", "0.0.0.0"
-            ], cwd=self.current_dir)
+            subprocess.run(command, cwd=self.current_dir)
         except KeyboardInterrupt:
             self.console.print("\n🛑 Server stopped")
             self.message_orchestrator.add_message('info', 'Development Server Stopped', 'Server shut down by user', 'Development')
     
+    def _load_yaml_config(self, path: Path) -> Dict[str, Any]:
+        """Load a YAML config file, memoized on its modification time
+        
+        Parsed configs are also kept as JSON in .framework_cache/yaml/, so later
+        runs read JSON instead of parsing the YAML again.
+        
+        Args:
+            path: Path to the YAML file
+            
+        Returns:
+            dict: Parsed configuration (empty if the file does not exist)
+        """
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        
+        cached = self._config_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        repo_root = self._get_repo_root()
+        try:
+            relative = path.resolve().relative_to(repo_root.resolve())
+            json_cache = repo_root / ".framework_cache" / "yaml" / (str(relative).replace('/', '__') + '.json')
+        except ValueError:
+            json_cache = None  # Outside the repository; parse without a persistent cache
+        
+        data = None
+        if json_cache:
+            try:
+                entry = self._read_cache_file(json_cache)
+                if entry.get('mtime_ns') == mtime_ns:
+                    data = entry['data']
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+        
+        if data is None:
+            import yaml
+            # libyaml-backed loader when available; pure-Python SafeLoader otherwise
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            with open(path, 'rb') as f:
+                data = yaml.load(f, Loader=loader) or {}
+            if json_cache:
+                self._cache_yaml_as_json(json_cache, mtime_ns, data)
+        
+        self._config_cache[path] = (mtime_ns, data)
+        return data
+    
+    def _cache_yaml_as_json(self, json_cache: Path, mtime_ns: int, data: Dict[str, Any]):
+        """Persist parsed YAML as JSON when it survives the round trip unchanged
+        
+        YAML values such as dates have no JSON equivalent; configs containing
+        them are simply not cached.
+        
+        Args:
+            json_cache: Cache file path
+            mtime_ns: Modification time of the source YAML file
+            data: Parsed YAML data
+        """
+        try:
+            encoded = orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8')
+            if (orjson.loads(encoded) if orjson else json.loads(encoded)) != data:
+                return
+            self._write_cache_file(json_cache, {'mtime_ns': mtime_ns, 'data': data})
+        except (TypeError, ValueError, OSError):
+            pass
+    
     def _get_professor_directory(self) -> str:
         """Get professor directory name from configuration."""
         # Try to get from build.yml first  
         try:
-            import yaml
             repo_root = self._get_repo_root()
                 
-            build_yml_path = repo_root / "build.yml"
-            if build_yml_path.exists():
-                with open(build_yml_path, 'r') as f:
-                    build_config = yaml.safe_load(f)
-                    prof_dir = build_config.get('structure', {}).get('professor_directory')
-                    if prof_dir:
-                        return prof_dir
+            build_config = self._load_yaml_config(repo_root / "build.yml")
+            prof_dir = build_config.get('structure', {}).get('professor_directory')
+            if prof_dir:
+                return prof_dir
             
             # Try class_template/course.yml
-            course_yml_path = repo_root / "class_template" / "course.yml"
-            if course_yml_path.exists():
-                with open(course_yml_path, 'r') as f:
-                    course_config = yaml.safe_load(f)
-                    prof_dir = course_config.get('structure', {}).get('professor_directory')
-                    if prof_dir:
-                        return prof_dir
+            course_config = self._load_yaml_config(repo_root / "class_template" / "course.yml")
+            prof_dir = course_config.get('structure', {}).get('professor_directory')
+            if prof_dir:
+                return prof_dir
         except Exception:
             pass
             
@@ -223,19 +593,20 @@ class OperationSequencer:
         else:
             student_dir = f"students/{self.context.github_user or 'unknown'}"
         
-        # Run sync script from repo root with correct parameters
-        sync_script = self.framework_dir / "scripts" / "sync_student.py"
-        
         # Create error callback for subprocess runner
         def error_callback(desc: str, error_text: str):
             self.message_orchestrator.add_message('errors', desc, error_text)
         
-        result = self.subprocess_runner.run_command(
-            command=["python3", str(sync_script), professor_dir, student_dir],
-            description="Syncing framework updates",
+        # Run sync script from repo root with correct parameters (uncaptured: it prompts the user)
+        result = self.subprocess_runner.run_framework_script(
+            script_name="sync_student.py",
             working_directory=repo_root,  # Run from repo root
+            framework_dir=self.framework_dir,
+            args=[professor_dir, student_dir],
+            description="Syncing framework updates",
             verbose=self.message_orchestrator.verbose,
-            error_callback=error_callback
+            error_callback=error_callback,
+            capture_output=False
         )
         
         if result.returncode != 0:
@@ -247,24 +618,31 @@ class OperationSequencer:
         # Regenerate after sync
         return self.validate_and_generate(force=True)
     
-    def build_production(self) -> bool:
+    def build_production(self, skip_validate: bool = False) -> bool:
         """Build production-ready static site
         
+        Args:
+            skip_validate: Skip validation and generation when the caller already ran it
+            
         Returns:
             bool: True if successful, False otherwise
         """
         
         self.message_orchestrator.start_operation("Production Build")
         
+        # Fail before validation rather than after it
+        if not self._require_hugo():
+            self.message_orchestrator.end_operation(False, "Hugo is not installed")
+            return False
+        
         # Ensure everything is up to date
-        if not self.validate_and_generate(force=True):
+        if not skip_validate and not self.validate_and_generate(force=True):
             self.message_orchestrator.end_operation(False, "Failed during validation phase")
             return False
             
         # Build with Hugo - NEW: Use root-level hugo_generated/
-        repo_root = self._get_repo_root()
-        output_dir = repo_root / "hugo_generated" / "public"
-        hugo_config = repo_root / "hugo_generated" / "hugo.toml"
+        output_dir = self._generated_dir / "public"
+        hugo_config = self._hugo_toml
         
         # Create error callback for subprocess runner
         def error_callback(desc: str, error_text: str):
@@ -272,7 +650,7 @@ class OperationSequencer:
         
         result = self.subprocess_runner.run_command(
             command=[
-                "hugo",
+                self._hugo_path,
                 "--destination", str(output_dir),
                 "--config", str(hugo_config),
                 "--environment", "production"
@@ -291,6 +669,36 @@ class OperationSequencer:
         self.message_orchestrator.end_operation(True, f"Static site ready in {output_dir}")
         return True
     
+    def development_build_pipeline(self, force: bool = False) -> bool:
+        """Prepare the site for the development server
+        
+        Same as the full build pipeline minus the static Hugo build: `hugo server`
+        renders and watches the site itself, so a production build beforehand
+        would be thrown away. Production output still requires --deploy.
+        
+        Args:
+            force: Skip user confirmation if True
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        
+        self.message_orchestrator.start_operation("Development Build Pipeline")
+        
+        if not force:
+            self.ux.show_pipeline_preview("Development Build Pipeline", ["Validation & Generation", "Grading JSON Generation", "Development Server"])
+            if not self.ux.show_build_confirmation():
+                self.message_orchestrator.end_operation(False, "Pipeline cancelled by user")
+                return False
+        
+        # Grading JSON generation runs inside the validation pipeline
+        if not self.validate_and_generate(force=True, with_grading_json=True):
+            self.message_orchestrator.end_operation(False, "Pipeline failed during validation")
+            return False
+        
+        self.message_orchestrator.end_operation(True, "Site ready for development server")
+        return True
+    
     def full_build_pipeline(self, force: bool = False) -> bool:
         """Run the complete build pipeline
         
@@ -309,21 +717,24 @@ class OperationSequencer:
                 self.message_orchestrator.end_operation(False, "Pipeline cancelled by user")
                 return False
         
-        # Step 1: Standard validation and generation
-        if not self.validate_and_generate(force=True):
-            self.message_orchestrator.end_operation(False, "Pipeline failed during validation")
+        # Checked once here; build_production reuses the cached result
+        if not self._require_hugo():
+            self.message_orchestrator.end_operation(False, "Hugo is not installed")
             return False
         
-        # Step 1.5: Generate all grading JSON files
-        if not self.generate_all_grading_json():
-            self.message_orchestrator.add_message('warnings', 'Grading JSON Generation Failed', 
-                'Failed to generate grading JSON files but continuing build')
+        # One progress display for every step's spinners (verbose mode only)
+        with self.subprocess_runner.shared_progress(self.message_orchestrator.verbose):
+            # Step 1: Standard validation and generation, with grading JSON generation
+            # overlapped with class context injection
+            if not self.validate_and_generate(force=True, with_grading_json=True):
+                self.message_orchestrator.end_operation(False, "Pipeline failed during validation")
+                return False
+            
+            # Step 2: Build production site (already validated in step 1)
+            if not self.build_production(skip_validate=True):
+                self.message_orchestrator.end_operation(False, "Pipeline failed during build")
+                return False
         
-        # Step 2: Build production site
-        if not self.build_production():
-            self.message_orchestrator.end_operation(False, "Pipeline failed during build")
-            return False
-                
         self.message_orchestrator.end_operation(True, "Complete build pipeline finished")
         return True
     
@@ -333,9 +744,10 @@ class OperationSequencer:
         self.ux.announce_cleaning_operation()
         
         # NEW: Clean files from root-level hugo_generated/
-        repo_root = self._get_repo_root()
         files_to_clean = [
-            repo_root / "hugo_generated"
+            self._generated_dir,
+            self._get_repo_root() / ".framework_cache",
+            self.current_dir / ".framework_cache"  # Content validation cache
         ]
         
         existing_files = [f for f in files_to_clean if f.exists()]
@@ -345,7 +757,14 @@ class OperationSequencer:
                 if file.is_file():
                     file.unlink()
                 elif file.is_dir():
-                    shutil.rmtree(file)
+                    if self.fast_clean:
+                        try:
+                            _fast_rmtree(os.fspath(file))
+                        except OSError:
+                            # Whatever the fast path left behind
+                            shutil.rmtree(file, ignore_errors=True)
+                    else:
+                        shutil.rmtree(file)
                 self.ux.show_file_removal_result(file)
     
     def inject_class_context(self, force: bool = False) -> bool:
@@ -363,18 +782,16 @@ class OperationSequencer:
         # Determine target directory based on current context
         target_directory = "professor" if self.role == "professor" else f"students/{self.current_dir.name}"
         
-        # Run the class context injection script
-        script_path = self.framework_dir / "scripts" / "inject_class_context.py"
-        
         # Create error callback for subprocess runner
         def error_callback(desc: str, error_text: str):
             self.message_orchestrator.add_message('errors', desc, error_text)
         
-        result = self.subprocess_runner.run_command(
-            command=["python3", str(script_path), target_directory],
-            description="Injecting class context for secure operations",
+        result = self.subprocess_runner.run_framework_script(
+            script_name="inject_class_context.py",
             working_directory=self.current_dir,
-            capture_output=True,
+            framework_dir=self.framework_dir,
+            args=[target_directory],
+            description="Injecting class context for secure operations",
             verbose=self.message_orchestrator.verbose,
             error_callback=error_callback
         )
@@ -395,18 +812,15 @@ class OperationSequencer:
         
         self.message_orchestrator.start_operation("Grading Data Parsing")
         
-        # Run the grading data parser
-        script_path = self.framework_dir / "scripts" / "parse_grading_data.py"
-        
         # Create error callback for subprocess runner
         def error_callback(desc: str, error_text: str):
             self.message_orchestrator.add_message('errors', desc, error_text)
         
-        result = self.subprocess_runner.run_command(
-            command=["python3", str(script_path)],
-            description="Parsing grading configuration files",
+        result = self.subprocess_runner.run_framework_script(
+            script_name="parse_grading_data.py",
             working_directory=self.current_dir,
-            capture_output=True,
+            framework_dir=self.framework_dir,
+            description="Parsing grading configuration files",
             verbose=self.message_orchestrator.verbose,
             error_callback=error_callback
         )
@@ -440,14 +854,14 @@ class OperationSequencer:
             return True
         
         # Run the grading data synchronizer
-        script_path = self.framework_dir / "scripts" / "sync_grading_data.py"
+        script_path = self._scripts_dir / "sync_grading_data.py"
         
         # Create error callback for subprocess runner
         def error_callback(desc: str, error_text: str):
             self.message_orchestrator.add_message('errors', desc, error_text)
         
         result = self.subprocess_runner.run_command(
-            command=["python3", str(script_path)],
+            command=[self.subprocess_runner.python_path, str(script_path)],
             description="Synchronizing grading data with Supabase",
             working_directory=self.current_dir,
             capture_output=True,
@@ -475,18 +889,15 @@ class OperationSequencer:
         
         self.message_orchestrator.start_operation("Item Parsing and Sync")
         
-        # Run the item parser
-        script_path = self.framework_dir / "scripts" / "parse_items.py"
-        
         # Create error callback for subprocess runner
         def error_callback(desc: str, error_text: str):
             self.message_orchestrator.add_message('errors', desc, error_text)
         
-        result = self.subprocess_runner.run_command(
-            command=["python3", str(script_path)],
-            description="Parsing items from markdown files",
+        result = self.subprocess_runner.run_framework_script(
+            script_name="parse_items.py",
             working_directory=self.current_dir,
-            capture_output=True,
+            framework_dir=self.framework_dir,
+            description="Parsing items from markdown files",
             verbose=self.message_orchestrator.verbose,
             error_callback=error_callback
         )
@@ -510,18 +921,15 @@ class OperationSequencer:
         
         self.message_orchestrator.start_operation("Grading JSON Generation")
         
-        # Run the grading JSON generator
-        script_path = self.framework_dir / "scripts" / "generate_all_grading_json.py"
-        
         # Create error callback for subprocess runner
         def error_callback(desc: str, error_text: str):
             self.message_orchestrator.add_message('errors', desc, error_text)
         
-        result = self.subprocess_runner.run_command(
-            command=["python3", str(script_path)],
-            description="Generating grading JSON files",
+        result = self.subprocess_runner.run_framework_script(
+            script_name="generate_all_grading_json.py",
             working_directory=self.current_dir,
-            capture_output=True,
+            framework_dir=self.framework_dir,
+            description="Generating grading JSON files",
             verbose=self.message_orchestrator.verbose,
             error_callback=error_callback
         )
@@ -549,7 +957,6 @@ class OperationSequencer:
         self.message_orchestrator.start_operation("Grading System Setup")
         
         if not force:
-            from rich.prompt import Confirm
             self.ux.show_pipeline_preview("Grading System Setup", [
                 "Parse Configuration", 
                 "Validate Data", 
@@ -557,7 +964,7 @@ class OperationSequencer:
                 "Parse Items",
                 "Inject Class Context"
             ])
-            if not Confirm.ask("Continue with grading system setup?"):
+            if not self.ux.get_user_confirmation("Continue with grading system setup?"):
                 self.message_orchestrator.end_operation(False, "Setup cancelled by user")
                 return False
         
@@ -620,8 +1027,8 @@ class OperationSequencer:
         # Step 2: Setup grading system (non-blocking)
         self.setup_grading_system(force=True)
         
-        # Step 3: Build production site
-        if not self.build_production():
+        # Step 3: Build production site (already validated in step 1)
+        if not self.build_production(skip_validate=True):
             self.message_orchestrator.end_operation(False, "Pipeline failed during Hugo build")
             return False
                 
@@ -7,12 +7,87 @@ and error collection, extracted from the original manage.py for better modularit
 Maintains exact compatibility with the original subprocess execution behavior.
 """
 
+import collections
+import contextlib
+import importlib
+import io
+import logging
+import os
+import shutil
 import subprocess
+import sys
+import threading
+import traceback
 from pathlib import Path
-from typing import List, Callable, Optional
+from typing import TYPE_CHECKING, List, Callable, Optional
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.markup import escape
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: spinners are only shown in verbose mode
+    from rich.progress import Progress
+
+# Lines of captured output kept for error reporting; older lines are dropped
+OUTPUT_TAIL_LINES = 4096
+
+# Longest output line shown next to a command's spinner
+SPINNER_LINE_WIDTH = 60
+
+
+@contextlib.contextmanager
+def _isolated_root_logging(stream: Optional[io.StringIO]):
+    """Give a script run its own root logger configuration
+    
+    Scripts call logging.basicConfig at import, which binds a handler to whatever
+    sys.stderr is at that moment. The root handlers and level are restored after
+    the run, so the next run configures logging afresh, as a child process would.
+    When output is captured, existing handlers on the real stderr write to the
+    capture buffer for the run.
+    
+    Args:
+        stream: Capture buffer standing in for sys.stderr, or None when not capturing
+    """
+    real_stderr = sys.stderr
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    
+    retargeted = []
+    if stream is not None:
+        for handler in saved_handlers:
+            if isinstance(handler, logging.StreamHandler) and handler.stream is real_stderr:
+                handler.setStream(stream)
+                retargeted.append(handler)
+    try:
+        yield
+    finally:
+        for handler in root.handlers:
+            if handler not in saved_handlers:
+                handler.close()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+        for handler in retargeted:
+            handler.setStream(real_stderr)
+
+
+def _unload_script_modules(scripts_dir: str, loaded_before: set):
+    """Drop framework modules a script run imported, so the next run starts clean
+    
+    Module globals (consoles, parsers, caches) would otherwise carry over from one
+    run to the next. Third-party modules such as yaml, rich and jinja2 stay loaded.
+    
+    Args:
+        scripts_dir: Directory holding the framework scripts
+        loaded_before: Names in sys.modules before the run
+    """
+    prefix = scripts_dir + os.sep
+    for name, module in list(sys.modules.items()):
+        if name in loaded_before:
+            continue
+        module_file = getattr(module, '__file__', None)
+        if module_file and os.path.abspath(module_file).startswith(prefix):
+            del sys.modules[name]
 
 
 class SubprocessRunner:
@@ -20,6 +95,61 @@ class SubprocessRunner:
     
     def __init__(self, console: Console = None):
         self.console = console or Console()
+        
+        # cwd and sys.stdout are process-wide, so in-process scripts run one at a time
+        self._in_process_lock = threading.Lock()
+        
+        # Interpreter for script subprocesses, resolved once instead of per call
+        self.python_path = shutil.which("python3") or sys.executable
+        
+        # Progress display shared by every command inside shared_progress()
+        self._progress: Optional["Progress"] = None
+        
+        # Run framework scripts as child processes instead of in-process (--force-subprocess)
+        self.force_subprocess = False
+    
+    @contextlib.contextmanager
+    def shared_progress(self, enabled: bool = True):
+        """Show the spinners of all commands run inside the block in one Progress
+        
+        Avoids starting and stopping a live display per command across a pipeline.
+        
+        Args:
+            enabled: Whether to open the shared display (typically verbose mode)
+        """
+        if not enabled or self._progress is not None:
+            yield
+            return
+        
+        with self._new_progress() as progress:
+            self._progress = progress
+            try:
+                yield
+            finally:
+                self._progress = None
+    
+    def _new_progress(self) -> "Progress":
+        """Create the spinner display used for commands"""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console,
+        )
+    
+    @contextlib.contextmanager
+    def _progress_task(self, description: str):
+        """Add a spinner task, to the shared Progress when one is open
+        
+        Yields:
+            tuple: (progress, task_id)
+        """
+        if self._progress is not None:
+            yield self._progress, self._progress.add_task(description, total=None)
+            return
+        
+        with self._new_progress() as progress:
+            yield progress, progress.add_task(description, total=None)
     
     def run_command(self, 
                    command: List[str], 
@@ -52,20 +182,15 @@ class SubprocessRunner:
             show_progress = verbose
             
         if show_progress:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-            ) as progress:
-                task = progress.add_task(description, total=None)
+            with self._progress_task(description) as (progress, task):
+                def show_line(line: str):
+                    # Latest output line next to the spinner while the command runs
+                    line = line.strip()
+                    if line:
+                        progress.update(task, description=f"{description} [dim]{escape(line[:SPINNER_LINE_WIDTH])}[/dim]")
                 
                 try:
-                    result = subprocess.run(
-                        command,
-                        capture_output=capture_output,
-                        text=True,
-                        cwd=working_directory
-                    )
+                    result = self._stream_command(command, working_directory, capture_output, verbose, show_line)
                     
                     if result.returncode == 0:
                         progress.update(task, description=f"✅ {description}")
@@ -84,12 +209,7 @@ class SubprocessRunner:
         else:
             # Silent execution for less verbose operations
             try:
-                result = subprocess.run(
-                    command,
-                    capture_output=capture_output,
-                    text=True,
-                    cwd=working_directory
-                )
+                result = self._stream_command(command, working_directory, capture_output, verbose)
                 
                 if result.returncode != 0 and result.stderr and error_callback:
                     error_callback(description, result.stderr.strip())
@@ -101,6 +221,63 @@ class SubprocessRunner:
                     error_callback(description, str(e))
                 raise
     
+    def _stream_command(self,
+                        command: List[str],
+                        working_directory: Path,
+                        capture_output: bool,
+                        verbose: bool,
+                        on_line: Optional[Callable[[str], None]] = None) -> subprocess.CompletedProcess:
+        """Run a command, reading captured output line by line as it is produced
+        
+        Only the last OUTPUT_TAIL_LINES lines of each stream are kept, so long Hugo
+        builds do not accumulate their whole output in memory. stderr is read on its
+        own pipe by a helper thread, so error reports carry only the error output.
+        
+        Args:
+            command: Command and arguments to execute
+            working_directory: Directory to run command in
+            capture_output: Whether to capture output (otherwise it goes to the terminal)
+            verbose: Whether to echo captured lines as they arrive
+            on_line: Called with each captured stdout line as it arrives
+            
+        Returns:
+            subprocess.CompletedProcess: Result with the stdout and stderr tails
+        """
+        if not capture_output:
+            with subprocess.Popen(command, cwd=working_directory) as proc:
+                return subprocess.CompletedProcess(command, proc.wait())
+        
+        stdout_tail = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+        stderr_tail = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+        with subprocess.Popen(command,
+                              cwd=working_directory,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE,
+                              text=True,
+                              bufsize=1) as proc:
+            def drain_stderr():
+                for line in proc.stderr:
+                    stderr_tail.append(line)
+                    if verbose:
+                        sys.stderr.write(line)
+            
+            # Both pipes must be drained concurrently, or a child filling one blocks
+            stderr_reader = threading.Thread(target=drain_stderr, daemon=True)
+            stderr_reader.start()
+            for line in proc.stdout:
+                stdout_tail.append(line)
+                if verbose:
+                    sys.stdout.write(line)
+                if on_line:
+                    on_line(line)
+            stderr_reader.join()
+            returncode = proc.wait()
+        
+        # Joined only on failure, where stderr becomes the error message
+        if returncode != 0:
+            return subprocess.CompletedProcess(command, returncode, "".join(stdout_tail), "".join(stderr_tail))
+        return subprocess.CompletedProcess(command, returncode, "", "")
+    
     def run_framework_script(self,
                            script_name: str,
                            working_directory: Path,
@@ -108,8 +285,11 @@ class SubprocessRunner:
                            args: List[str] = None,
                            description: str = None,
                            verbose: bool = False,
-                           error_callback: Optional[Callable[[str, str], None]] = None) -> subprocess.CompletedProcess:
-        """Run a framework script with standard conventions
+                           error_callback: Optional[Callable[[str, str], None]] = None,
+                           capture_output: bool = True) -> subprocess.CompletedProcess:
+        """Run a framework script in-process with standard conventions
+        
+        Falls back to a python3 child process when force_subprocess is set.
         
         Args:
             script_name: Name of the script (e.g., 'generate_hugo_config.py')
@@ -119,27 +299,100 @@ class SubprocessRunner:
             description: Human-readable description (auto-generated if None)
             verbose: Whether in verbose mode
             error_callback: Function to call with (description, error_text) on errors
+            capture_output: Whether to capture stdout/stderr (disable for interactive scripts)
             
         Returns:
             subprocess.CompletedProcess: Result of the script execution
         """
         
         script_path = framework_dir / "scripts" / script_name
-        command = ["python3", str(script_path)]
-        
-        if args:
-            command.extend(args)
             
         if description is None:
             description = f"Running {script_name}"
+        
+        if self.force_subprocess:
+            def execute():
+                command = [self.python_path, str(script_path)] + list(args or [])
+                return self._stream_command(command, working_directory, capture_output, verbose)
+        else:
+            def execute():
+                return self._run_script_main(script_path, args or [], working_directory, capture_output)
+        
+        if verbose:
+            with self._progress_task(description) as (progress, task):
+                result = execute()
+                icon = "✅" if result.returncode == 0 else "❌"
+                progress.update(task, description=f"{icon} {description}")
+        else:
+            result = execute()
+        
+        if result.returncode != 0 and result.stderr and error_callback:
+            error_callback(description, result.stderr.strip())
+            
+        return result
+    
+    def _run_script_main(self,
+                         script_path: Path,
+                         args: List[str],
+                         working_directory: Path,
+                         capture_output: bool) -> subprocess.CompletedProcess:
+        """Import a framework script and call its main(argv) in this interpreter
+        
+        Avoids a python3 fork+exec and the re-import of yaml/rich/jinja2 per script.
+        Framework modules the script imports are unloaded afterwards and the root
+        logger is restored, so each run starts from a clean state.
+        
+        Args:
+            script_path: Path to the script exposing main(argv) -> int
+            args: Arguments passed as argv
+            working_directory: Directory the script expects as its cwd
+            capture_output: Whether to capture stdout/stderr
             
-        return self.run_command(
-            command=command,
-            description=description,
-            working_directory=working_directory,
-            capture_output=True,
-            verbose=verbose,
-            error_callback=error_callback
+        Returns:
+            subprocess.CompletedProcess: Result shaped like a subprocess run
+        """
+        
+        command = [sys.executable, str(script_path)] + list(args)
+        stdout = io.StringIO() if capture_output else None
+        stderr = io.StringIO() if capture_output else None
+        
+        scripts_dir = os.path.abspath(script_path.parent)
+        
+        with self._in_process_lock:
+            previous_cwd = os.getcwd()
+            loaded_before = set(sys.modules)
+            try:
+                os.chdir(working_directory)
+                with contextlib.ExitStack() as stack:
+                    # Entered before the redirect, so it sees the real sys.stderr
+                    stack.enter_context(_isolated_root_logging(stderr))
+                    if capture_output:
+                        stack.enter_context(contextlib.redirect_stdout(stdout))
+                        stack.enter_context(contextlib.redirect_stderr(stderr))
+                    
+                    try:
+                        if scripts_dir not in sys.path:
+                            sys.path.insert(0, scripts_dir)
+                        module = importlib.import_module(script_path.stem)
+                        returncode = module.main(list(args)) or 0
+                    except SystemExit as e:
+                        if e.code is None or isinstance(e.code, int):
+                            returncode = e.code or 0
+                        else:
+                            print(e.code, file=sys.stderr)
+                            returncode = 1
+                    except Exception:
+                        traceback.print_exc()
+                        returncode = 1
+            finally:
+                os.chdir(previous_cwd)
+                _unload_script_modules(scripts_dir, loaded_before)
+        
+        return subprocess.CompletedProcess(
+            command,
+            returncode,
+            stdout.getvalue() if capture_output else None,
+            stderr.getvalue() if capture_output else None
         )
     
     def check_command_available(self, command: str) -> bool:
@@ -152,15 +405,8 @@ class SubprocessRunner:
             bool: True if command is available, False otherwise
         """
         
-        try:
-            result = subprocess.run(
-                ["which", command],
-                capture_output=True,
-                text=True
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        # PATH lookup without spawning `which`
+        return shutil.which(command) is not None
 
 
 if __name__ == "__main__":
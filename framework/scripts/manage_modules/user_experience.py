@@ -7,12 +7,12 @@ and interactive flows extracted from the original manage.py for better modularit
 Maintains exact compatibility with the original user interaction behavior.
 """
 
+import sys
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Confirm
 from rich.table import Table
 
 
@@ -65,7 +65,37 @@ class UserExperience:
         if force:
             return True
         
-        return Confirm.ask(message)
+        return self._confirm(message)
+    
+    def _confirm(self, message: str, default: bool = False) -> bool:
+        """Ask a yes/no question with a single line read from stdin
+        
+        Answers can be piped in (e.g. ``echo y | ./manage.sh --build``). When
+        stdin is not a terminal and the default is yes, no line is read.
+        
+        Args:
+            message: Question to display
+            default: Answer used for an empty line or end of input
+            
+        Returns:
+            bool: True if the answer is yes
+        """
+        
+        if default and not sys.stdin.isatty():
+            return True
+        
+        choices = "\\[Y/n]" if default else "\\[y/N]"
+        self.console.print(f"{message} [bold magenta]{choices}[/bold magenta]: ", end="")
+        answer = sys.stdin.readline()
+        if not answer:
+            # End of input: finish the prompt line before falling back
+            self.console.print()
+            return default
+        
+        answer = answer.strip().lower()
+        if not answer:
+            return default
+        return answer in ('y', 'yes')
     
     def announce_operation(self, operation_name: str, description: str = None):
         """Announce start of a major operation
@@ -114,7 +144,7 @@ class UserExperience:
         for file in files:
             self.console.print(f"• {file}")
             
-        return Confirm.ask("Remove these files?")
+        return self._confirm("Remove these files?")
     
     def show_file_removal_result(self, file_path: Path):
         """Show result of file removal
@@ -218,7 +248,7 @@ class UserExperience:
             bool: True if user confirms
         """
         
-        return Confirm.ask("Run validation and regenerate all framework files?")
+        return self._confirm("Run validation and regenerate all framework files?")
     
     def show_build_confirmation(self) -> bool:
         """Show build pipeline confirmation
@@ -227,7 +257,7 @@ class UserExperience:
             bool: True if user confirms
         """
         
-        return Confirm.ask("Continue with full build?")
+        return self._confirm("Continue with full build?")
     
     def show_sync_confirmation(self) -> bool:
         """Show sync operation confirmation
@@ -236,7 +266,7 @@ class UserExperience:
             bool: True if user confirms
         """
         
-        return Confirm.ask("Continue with sync?")
+        return self._confirm("Continue with sync?")
     
     def show_publish_confirmation(self) -> bool:
         """Show publish pipeline confirmation
@@ -245,7 +275,7 @@ class UserExperience:
             bool: True if user confirms
         """
         
-        return Confirm.ask("Continue with complete publish?")
+        return self._confirm("Continue with complete publish?")
 
 
 if __name__ == "__main__":
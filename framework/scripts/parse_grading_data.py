@@ -470,10 +470,15 @@ class GradingDataParser:
             self.console.print("\n✅ [bold green]All validation checks passed[/bold green]")
 
 
-def main():
-    """Main function for standalone execution"""
-    import sys
+def main(argv=None) -> int:
+    """Main function for standalone execution
     
+    Args:
+        argv: Command line arguments (unused; accepted for in-process runs)
+        
+    Returns:
+        int: Exit code (0 on success)
+    """
     console = Console()
     
     # Determine content directory
@@ -498,7 +503,7 @@ def main():
         console.print("Searched paths:")
         for path in search_paths:
             console.print(f"   • {path}")
-        sys.exit(1)
+        return 1
     
     console.print(f"📁 Using grading data from: {grading_dir}")
     
@@ -518,10 +523,11 @@ def main():
     
     if not success:
         console.print("\n❌ Parsing completed with errors")
-        sys.exit(1)
+        return 1
     else:
         console.print("\n✅ Parsing completed successfully")
+        return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    exit(main())
\ No newline at end of file
@@ -20,6 +20,37 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _iter_markdown_files(directory: str):
+    """
+    Recursively yield markdown files under a directory, in Path.rglob order.
+    
+    Uses os.scandir, whose entries carry their file type, so only the matching
+    files become Path objects and no entry is stat-ed twice. Each directory's
+    own files come before its subdirectories; symlinked directories are not
+    followed.
+    
+    Args:
+        directory: Directory to walk
+        
+    Yields:
+        Path objects for .md files
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+    
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.name.endswith('.md') and entry.is_file():
+            yield Path(entry.path)
+    
+    for subdir in subdirs:
+        yield from _iter_markdown_files(subdir)
+
 class Item:
     """Represents a graded item parsed from markdown content"""
     
@@ -86,7 +117,7 @@ class ItemParser:
         self.class_id = self._load_class_id()
         
         # Find all markdown files recursively
-        markdown_files = list(self.class_notes_dir.rglob("*.md"))
+        markdown_files = list(_iter_markdown_files(os.fspath(self.class_notes_dir)))
         
         for file_path in markdown_files:
             # Skip auto-generated index files
@@ -419,8 +450,15 @@ class ItemParser:
         else:
             logger.info("✅ All item references validated successfully")
 
-def main():
-    """Main function for command-line usage"""
+def main(argv=None) -> int:
+    """Main function for command-line usage
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: Exit code (0 on success)
+    """
     import argparse
     
     parser = argparse.ArgumentParser(description='Parse graded items from markdown files')
@@ -433,7 +471,7 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -446,7 +484,7 @@ def main():
     
     if not parsed_files:
         logger.warning("No items found in class_notes directory")
-        return
+        return 0
     
     # Generate configuration
     output_path = os.path.join(args.output_dir, args.output_file)
@@ -456,6 +494,7 @@ def main():
     print(f"   📁 Files processed: {len(parsed_files)}")
     print(f"   📝 Items found: {sum(len(pf.items) for pf in parsed_files)}")
     print(f"   💾 Config saved: {output_path}")
+    return 0
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    exit(main())
\ No newline at end of file
@@ -342,7 +342,7 @@ def show_sync_summary(student_name, changes, results):
         
         console.print(tree)
 
-def main(professor_dir=None, student_dir=None):
+def sync(professor_dir=None, student_dir=None):
     """Main sync process."""
     console.print(Panel(
         "[bold blue]📚 Student Content Sync Tool[/bold blue]\n\n"
@@ -438,19 +438,35 @@ def main(professor_dir=None, student_dir=None):
         border_style="green"
     ))
 
-if __name__ == "__main__":
+def main(argv=None) -> int:
+    """Command line entry point.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: Exit code (0 on success)
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
     console.print("\n[bold blue]🎓 GitHub Class Template - Student Content Sync[/bold blue]")
     console.print("[dim]Syncs class content from professor to student directories (framework shared at root)[/dim]")
     
     try:
         # Check for command line arguments
-        professor_dir = sys.argv[1] if len(sys.argv) > 1 else None
-        student_dir = sys.argv[2] if len(sys.argv) > 2 else None
+        professor_dir = argv[0] if len(argv) > 0 else None
+        student_dir = argv[1] if len(argv) > 1 else None
         
-        main(professor_dir, student_dir)
+        sync(professor_dir, student_dir)
     except KeyboardInterrupt:
         console.print("\n[yellow]⚠️  Sync cancelled by user[/yellow]")
-        sys.exit(1)
+        return 1
     except Exception as e:
         console.print(f"\n[red]❌ Sync failed: {e}[/red]")
-        sys.exit(1) 
\ No newline at end of file
+        return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test Script for In-Process Framework Script Execution
+This script checks that repeated in-process runs each start clean and capture their own output
+"""
+
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from manage_modules.subprocess_runner import SubprocessRunner
+
+# Configures logging at import, like parse_items.py and the convert_items scripts
+LOGGING_SCRIPT = '''
+import logging
+import sys
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Module state; a fresh import starts it empty
+RUNS = []
+
+def main(argv=None):
+    RUNS.append(argv[0])
+    logger.info("run %s", argv[0])
+    print("stdout", argv[0], len(RUNS))
+    if "--verbose" in argv:
+        logging.getLogger().setLevel(logging.DEBUG)
+    return int(argv[1]) if len(argv) > 1 else 0
+'''
+
+
+def test_repeated_runs_capture_stderr():
+    """Each run starts clean and its log output lands in its own stderr"""
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    # basicConfig only configures a root logger without handlers, as in a fresh manage.py
+    root.handlers.clear()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        framework_dir = Path(temp_dir)
+        scripts_dir = framework_dir / "scripts"
+        scripts_dir.mkdir()
+        (scripts_dir / "logging_probe.py").write_text(LOGGING_SCRIPT)
+
+        runner = SubprocessRunner()
+        try:
+            results = [
+                runner.run_framework_script("logging_probe.py", framework_dir, framework_dir,
+                                            args=[f"run{i}", "0", "--verbose"] if i == 0 else [f"run{i}", "1"])
+                for i in range(3)
+            ]
+            handlers_after_runs, level_after_runs = root.handlers[:], root.level
+        finally:
+            sys.path.remove(str(scripts_dir))
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+
+    for i, result in enumerate(results):
+        assert f"INFO:logging_probe:run run{i}" in result.stderr, result.stderr
+        assert f"run{i - 1}" not in result.stderr, result.stderr
+        # The script module is imported afresh for every run
+        assert result.stdout == f"stdout run{i} 1\n", result.stdout
+
+    assert [result.returncode for result in results] == [0, 1, 1]
+
+    # Handlers and levels set by the runs, including --verbose, do not outlive them
+    assert handlers_after_runs == [], handlers_after_runs
+    assert level_after_runs == saved_level, level_after_runs
+    assert "logging_probe" not in sys.modules
+
+
+def main() -> int:
+    """Run the checks in this file"""
+
+    try:
+        test_repeated_runs_capture_stderr()
+    except AssertionError as e:
+        print(f"❌ Repeated in-process runs: {e}")
+        return 1
+
+    print("✅ Repeated in-process runs start clean and capture their own output")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,12 +14,27 @@ Exit codes:
     2: Script execution error
 """
 
+import os
 import sys
+import json
 import argparse
+import functools
+import io
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Tuple
 import yaml
 
+# Prefer the libyaml-backed loader; the pure-Python SafeLoader is several times slower
+try:
+    from yaml import CSafeLoader as _Loader
+    _HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _Loader
+    _HAS_LIBYAML = False
+
 from rich.console import Console
 from rich.progress import Progress, TaskID
 from rich.panel import Panel
@@ -58,17 +73,93 @@ except ImportError:
         return set()
     def should_have_discussions(*args, **kwargs):
         return False
-    DISCUSSION_ENABLED_TYPES = []
+    DISCUSSION_ENABLED_TYPES = ()
 
 console = Console()
 
+# Below this many files, validating serially beats starting forked worker processes
+PARALLEL_MIN_FILES = 200
+
+# The same threshold when workers cannot be forked. A forkserver or spawned worker
+# starts a fresh interpreter and re-imports yaml, rich and this module: about
+# 200-260 ms to get a pool running, against roughly 10 ms for fork and 0.12 ms
+# per ~40 KB file validated serially. Below a few thousand files, serial wins.
+PARALLEL_MIN_FILES_NO_FORK = 4000
+
+# Per-file results cache, relative to the validated base directory
+CACHE_FILE = Path('.framework_cache') / 'content_validation.json'
+
+# Validator sources; editing either invalidates every cached result
+VALIDATOR_SOURCES = ('validate_content.py', 'content_metadata.py')
+
+
+# Shared by every _validate_file_worker call in this process; parse_frontmatter
+# starts each file with fresh error and warning lists
+_WORKER_PARSER = MetadataParser()
+
+
+def _validate_file_worker(file_path: Path, base_dir: Path) -> Dict:
+    """
+    Validate a single content file without touching shared state.
+    
+    Module-level so worker processes can run it.
+    
+    Args:
+        file_path: Path to the file to validate
+        base_dir: Base directory used for the displayed relative path
+        
+    Returns:
+        dict: Result record with file, errors, warnings and metadata
+    """
+    # Initialize result record
+    result = {
+        'file': str(file_path.relative_to(base_dir)),
+        'errors': [],
+        'warnings': [],
+        'metadata': {}
+    }
+    
+    # File naming validation
+    result['errors'].extend(validate_file_naming(file_path))
+    
+    # Metadata validation
+    metadata, meta_errors, meta_warnings = _WORKER_PARSER.parse_frontmatter(file_path)
+    result['metadata'] = metadata
+    result['errors'].extend(meta_errors)
+    result['warnings'].extend(meta_warnings)
+    
+    return result
+
+
+def _process_pool_context():
+    """
+    Multiprocessing context for validation workers.
+    
+    Plain fork is cheapest, but only when this is the only thread: forking while
+    other threads run can deadlock the child. In the build pipeline other threads
+    usually are running (the hugo.toml render in generate_hugo_config, manage.py's
+    concurrent stages and progress display), so there the forkserver is the usual
+    result, and _iter_validated only uses it for very large file sets
+    (PARALLEL_MIN_FILES_NO_FORK).
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if threading.active_count() == 1 and 'fork' in methods:
+        return multiprocessing.get_context('fork')
+    if 'forkserver' in methods:
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context()
+
+
 class ContentValidator:
     """Main content validation system"""
     
-    def __init__(self, base_dir: Path, strict_mode: bool = False):
+    def __init__(self, base_dir: Path, strict_mode: bool = False, use_cache: bool = True):
         self.base_dir = base_dir
         self.strict_mode = strict_mode
-        self.parser = MetadataParser()
+        
+        # Results of unchanged files are reused from the previous run
+        self.use_cache = use_cache
+        self.cache_file = base_dir / CACHE_FILE
         
         # Validation statistics
         self.stats = {
@@ -110,13 +201,33 @@ class ContentValidator:
         
         console.print(f"\n[bold]Found {len(content_files)} content files[/bold]")
         
-        # Validate each file with progress bar
+        # Files unchanged since the last run keep their cached result
+        results, file_stats = self._load_cached_results(content_files)
+        stale_files = [file_path for file_path in content_files if file_path not in results]
+        
+        # Validate the rest with progress bar
         with Progress() as progress:
             task = progress.add_task("[cyan]Validating content...", total=len(content_files))
+            progress.update(task, advance=len(results))
             
-            for file_path in content_files:
-                self._validate_single_file(file_path)
-                progress.update(task, advance=1)
+            # The bar redraws on its own timer; advance it in batches of ~0.5%
+            # rather than taking its lock for every file
+            batch_size = max(1, len(stale_files) // 200)
+            pending = 0
+            for file_path, result in zip(stale_files, self._iter_validated(stale_files)):
+                results[file_path] = result
+                pending += 1
+                if pending >= batch_size:
+                    progress.update(task, advance=pending)
+                    pending = 0
+            if pending:
+                progress.update(task, advance=pending)
+        
+        # Record in discovery order, so reports stay sorted by path
+        for file_path in content_files:
+            self._record_result(results[file_path])
+        
+        self._save_cache(results, file_stats)
         
         # Display results
         self._display_results()
@@ -126,35 +237,134 @@ class ContentValidator:
             return not self.strict_mode
         return True
     
-    def _validate_single_file(self, file_path: Path) -> None:
+    def _iter_validated(self, content_files: List[Path]):
         """
-        Validate a single content file.
+        Validate files, yielding results in input order.
+        
+        Files are independent, so large sets are spread over worker processes.
         
         Args:
-            file_path: Path to the file to validate
+            content_files: Files to validate
+            
+        Yields:
+            dict: Result record per file
         """
-        self.stats['files_processed'] += 1
+        workers = os.cpu_count() or 1
+        mp_context = _process_pool_context()
+        min_files = PARALLEL_MIN_FILES if mp_context.get_start_method() == 'fork' else PARALLEL_MIN_FILES_NO_FORK
+        if workers == 1 or len(content_files) < min_files:
+            for file_path in content_files:
+                yield _validate_file_worker(file_path, self.base_dir)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            yield from executor.map(
+                _validate_file_worker,
+                content_files,
+                [self.base_dir] * len(content_files),
+                chunksize=max(1, len(content_files) // (workers * 4))
+            )
+    
+    def _load_cached_results(self, content_files: List[Path]) -> Tuple[Dict[Path, Dict], Dict[Path, Tuple[int, int]]]:
+        """
+        Look up cached results for files whose (mtime, size) is unchanged.
+        
+        Args:
+            content_files: Files about to be validated
+            
+        Returns:
+            Tuple of (cached results by path, (st_mtime_ns, st_size) by path)
+        """
+        file_stats = {}
+        for file_path in content_files:
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue  # Validation reports the read error
+            file_stats[file_path] = (st.st_mtime_ns, st.st_size)
         
-        # Relative path for display
-        rel_path = file_path.relative_to(self.base_dir)
+        if not self.use_cache:
+            return {}, file_stats
         
-        # Initialize result record
-        result = {
-            'file': str(rel_path),
-            'errors': [],
-            'warnings': [],
-            'metadata': {}
-        }
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('validator') != self._validator_fingerprint():
+                return {}, file_stats
+            entries = cache['files']
+        except (OSError, ValueError, KeyError, AttributeError):
+            return {}, file_stats
+        
+        results = {}
+        for file_path, stat_key in file_stats.items():
+            rel_path = str(file_path.relative_to(self.base_dir))
+            entry = entries.get(rel_path)
+            if entry and [entry.get('mtime_ns'), entry.get('size')] == list(stat_key):
+                results[file_path] = {
+                    'file': rel_path,
+                    'errors': entry['errors'],
+                    'warnings': entry['warnings'],
+                    'metadata': entry['metadata']
+                }
+        return results, file_stats
+    
+    def _save_cache(self, results: Dict[Path, Dict], file_stats: Dict[Path, Tuple[int, int]]) -> None:
+        """
+        Store this run's results for the next run.
+        
+        Written to a temporary file that replaces the cache, so an interrupted
+        run never leaves a truncated cache. Failures are ignored; the next run
+        simply validates everything again.
+        
+        Args:
+            results: Result records by path
+            file_stats: (st_mtime_ns, st_size) by path, taken before validation
+        """
+        if not self.use_cache:
+            return
         
-        # File naming validation
-        naming_errors = validate_file_naming(file_path)
-        result['errors'].extend(naming_errors)
+        entries = {}
+        for file_path, (mtime_ns, size) in file_stats.items():
+            result = results[file_path]
+            entries[result['file']] = {
+                'mtime_ns': mtime_ns,
+                'size': size,
+                'errors': result['errors'],
+                'warnings': result['warnings'],
+                'metadata': result['metadata']
+            }
         
-        # Metadata validation
-        metadata, meta_errors, meta_warnings = self.parser.parse_frontmatter(file_path)
-        result['metadata'] = metadata
-        result['errors'].extend(meta_errors)
-        result['warnings'].extend(meta_warnings)
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_file.with_suffix('.json.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                # Dates in metadata are stored as strings
+                json.dump({'validator': self._validator_fingerprint(), 'files': entries}, f, default=str)
+            os.replace(tmp, self.cache_file)
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    @staticmethod
+    def _validator_fingerprint() -> List:
+        """(name, st_mtime_ns, st_size) of the validator sources, as stored in the cache"""
+        scripts_dir = Path(__file__).parent
+        fingerprint = []
+        for name in VALIDATOR_SOURCES:
+            try:
+                st = (scripts_dir / name).stat()
+                fingerprint.append([name, st.st_mtime_ns, st.st_size])
+            except OSError:
+                fingerprint.append([name, None, None])
+        return fingerprint
+    
+    def _record_result(self, result: Dict) -> None:
+        """
+        Add a file's validation result to the statistics and report.
+        
+        Args:
+            result: Result record from _validate_file_worker
+        """
+        self.stats['files_processed'] += 1
         
         # Update statistics
         if result['errors']:
@@ -170,28 +380,42 @@ class ContentValidator:
         self.results.append(result)
     
     def _display_results(self) -> None:
-        """Display validation results with rich formatting"""
+        """Display validation results with rich formatting
+        
+        The report is rendered into an in-memory console with the same colour
+        and width settings as the real one, then written to the terminal once.
+        """
+        
+        out = Console(
+            file=io.StringIO(),
+            force_terminal=console.is_terminal,
+            color_system=console.color_system,
+            width=console.width
+        )
         
         # Summary statistics
-        self._display_summary()
+        self._display_summary(out)
         
         # Detailed error reports
         if self.stats['files_with_errors'] > 0:
-            self._display_errors()
+            self._display_errors(out)
         
         # Warning reports (if any)
         if self.stats['files_with_warnings'] > 0:
-            self._display_warnings()
+            self._display_warnings(out)
         
         # Success message or failure summary
         if self.stats['files_with_errors'] == 0:
-            console.print(f"\n[bold green]✅ All {self.stats['files_processed']} files passed validation![/bold green]")
+            out.print(f"\n[bold green]✅ All {self.stats['files_processed']} files passed validation![/bold green]")
             if self.stats['total_warnings'] > 0:
-                console.print(f"[yellow]⚠️  {self.stats['total_warnings']} warnings found (non-critical)[/yellow]")
+                out.print(f"[yellow]⚠️  {self.stats['total_warnings']} warnings found (non-critical)[/yellow]")
         else:
-            console.print(f"\n[bold red]❌ Validation failed with {self.stats['total_errors']} errors[/bold red]")
+            out.print(f"\n[bold red]❌ Validation failed with {self.stats['total_errors']} errors[/bold red]")
+        
+        console.file.write(out.file.getvalue())
+        console.file.flush()
     
-    def _display_summary(self) -> None:
+    def _display_summary(self, out: Console) -> None:
         """Display summary statistics table"""
         
         table = Table(title="Validation Summary", box=box.ROUNDED)
@@ -231,12 +455,12 @@ class ContentValidator:
             "[yellow]⚠️[/yellow]" if self.stats['total_warnings'] > 0 else "—"
         )
         
-        console.print(table)
+        out.print(table)
     
-    def _display_errors(self) -> None:
+    def _display_errors(self, out: Console) -> None:
         """Display detailed error reports"""
         
-        console.print(Panel.fit(
+        out.print(Panel.fit(
             "[bold red]Validation Errors[/bold red]",
             title="❌ Issues Requiring Attention"
         ))
@@ -245,14 +469,14 @@ class ContentValidator:
             if not result['errors']:
                 continue
             
-            console.print(f"\n[bold red]📄 {result['file']}[/bold red]")
+            out.print(f"\n[bold red]📄 {result['file']}[/bold red]")
             for error in result['errors']:
-                console.print(f"   [red]• {error}[/red]")
+                out.print(f"   [red]• {error}[/red]")
     
-    def _display_warnings(self) -> None:
+    def _display_warnings(self, out: Console) -> None:
         """Display warning reports"""
         
-        console.print(Panel.fit(
+        out.print(Panel.fit(
             "[bold yellow]Validation Warnings[/bold yellow]",
             title="⚠️  Non-Critical Issues"
         ))
@@ -261,9 +485,9 @@ class ContentValidator:
             if not result['warnings']:
                 continue
             
-            console.print(f"\n[bold yellow]📄 {result['file']}[/bold yellow]")
+            out.print(f"\n[bold yellow]📄 {result['file']}[/bold yellow]")
             for warning in result['warnings']:
-                console.print(f"   [yellow]• {warning}[/yellow]")
+                out.print(f"   [yellow]• {warning}[/yellow]")
 
 def load_validation_config(base_dir: Path) -> Dict:
     """
@@ -275,23 +499,34 @@ def load_validation_config(base_dir: Path) -> Dict:
     Returns:
         Configuration dictionary
     """
-    # Try multiple locations for dna.yml
-    dna_paths = [
-        base_dir / 'dna.yml',  # Same directory
-        base_dir / '../dna.yml',  # Parent directory (for student directories)
-        base_dir / '../../dna.yml'  # Repository root (for nested student directories)
-    ]
+    return dict(_load_validation_config(os.path.abspath(base_dir)))
+
+@functools.lru_cache(maxsize=8)
+def _load_validation_config(base_dir: str) -> Tuple[Tuple[str, bool], ...]:
+    """Parse the validation settings from dna.yml, memoized per absolute base directory
     
+    Args:
+        base_dir: Absolute base directory to search for dna.yml
+        
+    Returns:
+        tuple: (key, value) pairs of the configuration
+    """
     config = {
         'strict_validation': False,
         'content_validation': True
     }
     
-    for dna_path in dna_paths:
+    # Try multiple locations for dna.yml; the first one found wins
+    for relative_path in (
+        'dna.yml',  # Same directory
+        '../dna.yml',  # Parent directory (for student directories)
+        '../../dna.yml'  # Repository root (for nested student directories)
+    ):
+        dna_path = Path(base_dir) / relative_path
         if dna_path.exists():
             try:
                 with open(dna_path, 'r') as f:
-                    dna_config = yaml.safe_load(f) or {}
+                    dna_config = yaml.load(f, Loader=_Loader) or {}
                 
                 if 'strict_validation' in dna_config:
                     config['strict_validation'] = bool(dna_config['strict_validation'])
@@ -303,7 +538,7 @@ def load_validation_config(base_dir: Path) -> Dict:
                 console.print(f"[yellow]Warning: Could not read {dna_path}: {e}[/yellow]")
                 continue
     
-    return config
+    return tuple(config.items())
 
 def main():
     """Main entry point for content validation"""
@@ -327,9 +562,18 @@ def main():
         action='store_true',
         help='Skip loading configuration from dna.yml'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Revalidate every file instead of reusing results for unchanged files'
+    )
     
     args = parser.parse_args()
     
+    if not _HAS_LIBYAML:
+        console.print("[yellow]⚠️  PyYAML is running without libyaml; validation of large trees will be slow[/yellow]")
+        console.print("[yellow]   Reinstall PyYAML against libyaml, e.g.: apt-get install libyaml-dev && pip install --no-binary pyyaml pyyaml[/yellow]")
+    
     # Resolve base directory
     base_dir = Path(args.base_dir).resolve()
     if not base_dir.exists():
@@ -352,7 +596,7 @@ def main():
     
     try:
         # Run validation
-        validator = ContentValidator(base_dir, config['strict_validation'])
+        validator = ContentValidator(base_dir, config['strict_validation'], use_cache=not args.no_cache)
         success = validator.validate_all_content()
         
         # Exit with appropriate code